@@ -1,7 +1,15 @@
-from typing import Dict, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
-from ai_job_agent.models.application_history import ApplicationHistory
-from datetime import datetime
+from ai_job_agent.models.application_history import ApplicationHistory, STATUSES
+
+# Shared read-only placeholder answers; prepare_answers is called once per
+# application, so avoid rebuilding the same dict thousands of times.
+_DEFAULT_ANSWERS: Mapping[str, Any] = MappingProxyType({
+    "why_hire": "I match the role requirements and can deliver impact quickly.",
+    "relevant_experience": "3+ projects using similar stack and workflows.",
+    "notice_period": "Immediate",
+})
 
 @dataclass
 class ApplicationConfig:
@@ -16,15 +24,12 @@ class ApplicationAgent:
     def __init__(self, config: Optional[ApplicationConfig] = None) -> None:
         self.config = config or ApplicationConfig()
 
-    def prepare_answers(self, job: Dict[str, Any], resume: Optional[str] = None) -> Dict[str, Any]:
+    def prepare_answers(self, job: Dict[str, Any], resume: Optional[str] = None) -> Mapping[str, Any]:
         """
         Produce simple placeholder Q&A for application forms.
+        Returns a shared read-only mapping; copy with dict() before mutating.
         """
-        return {
-            "why_hire": "I match the role requirements and can deliver impact quickly.",
-            "relevant_experience": "3+ projects using similar stack and workflows.",
-            "notice_period": "Immediate",
-        }
+        return _DEFAULT_ANSWERS
 
     def apply(self, job_id: str, answers: Dict[str, Any]) -> Tuple[bool, ApplicationHistory]:
         """
@@ -40,8 +45,7 @@ class ApplicationAgent:
 
         history = ApplicationHistory(
             job_id=job_id,
-            status="submitted" if success else "failed",
-            timestamp=datetime.utcnow(),
+            status=STATUSES["submitted" if success else "failed"],
             answers=answers,
             error_reason=reason,
         )
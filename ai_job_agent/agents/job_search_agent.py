@@ -1,6 +1,17 @@
+import asyncio
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
+from itertools import islice
 from ai_job_agent.models.job_data import JobData
+from ai_job_agent.utils.bloom_filter import BloomFilter
+
+def decode_jobs(raw: bytes) -> List[JobData]:
+    """
+    Bulk-decode a JSON array of job postings into JobData models.
+    The shared list adapter parses and validates the whole response body
+    inside pydantic-core in one pass, instead of per-item constructors.
+    """
+    return JobData.parse_many(raw)
 
 @dataclass
 class JobSearchConfig:
@@ -18,33 +29,122 @@ class JobSearchAgent:
 
     def __init__(self, config: Optional[JobSearchConfig] = None) -> None:
         self.config = config or JobSearchConfig()
+        # Source name -> bound fetcher, built once; dispatch is a dict
+        # probe instead of a growing if/elif chain of string compares.
+        self._dispatch = {
+            "linkedin": self._search_linkedin,
+            "naukri": self._search_naukri,
+        }
 
     def search(self, criteria: Optional[Dict[str, Any]] = None) -> List[JobData]:
         """
         Return a list of JobData items based on criteria.
-        Currently returns a static placeholder list.
+        Consumes at most config.limit items from the lazy pipeline, so
+        scraping short-circuits instead of materializing every result.
+        """
+        criteria = criteria or {}
+        filtered = self._filter_jobs(self._iter_jobs(criteria), criteria)
+        return list(islice(filtered, self.config.limit))
+
+    def _filter_jobs(self, jobs, criteria: Dict[str, Any]):
+        """
+        Dedup and criteria-filter jobs in a single lazy pass.
+        Duplicate detection and _matches_criteria are fused into one loop
+        keyed on JobData.dedup_key, so each job is touched once and the
+        casefolded key is never rebuilt per comparison.
+        """
+        seen = set()
+        # Bloom miss == definitely new: most jobs skip the exact-set probe
+        # entirely and only possible duplicates fall through to it.
+        bloom = BloomFilter(capacity=8192, error_rate=0.001)
+        # Pre-bound callables keep the per-job cost to plain calls instead
+        # of repeated attribute lookups inside the hot loop.
+        seen_add = seen.add
+        bloom_add = bloom.add
+        matches = self._matches_criteria
+        for job in jobs:
+            key = job.dedup_key
+            if key in bloom and key in seen:
+                continue
+            bloom_add(key)
+            seen_add(key)
+            if matches(job, criteria):
+                yield job
+
+    def _matches_criteria(self, job: JobData, criteria: Dict[str, Any]) -> bool:
+        """Return True if the job passes the configured source filter."""
+        sources = criteria.get("sources") or self.config.sources
+        return job.source is None or job.source in sources
+
+    async def search_platforms(self, platforms: List[Any],
+                               criteria: Optional[Dict[str, Any]] = None,
+                               max_concurrency: int = 5) -> List[Dict[str, Any]]:
+        """
+        Fan a search out across platform bots concurrently.
+        Each bot's blocking search_jobs runs in the default executor under
+        a bounded semaphore, so wall time is the slowest platform rather
+        than the sum of all of them (no fixed inter-platform sleeps).
+        A platform that raises is skipped instead of failing the batch.
         """
         criteria = criteria or {}
+        query = criteria.get("title") or self.config.title or ""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _search_platform_async(platform):
+            async with semaphore:
+                return await loop.run_in_executor(
+                    None, platform.search_jobs, query, criteria
+                )
+
+        results = await asyncio.gather(
+            *(_search_platform_async(p) for p in platforms),
+            return_exceptions=True,
+        )
+        jobs: List[Dict[str, Any]] = []
+        for result in results:
+            if not isinstance(result, Exception):
+                jobs.extend(result)
+        return jobs
+
+    def _iter_jobs(self, criteria: Dict[str, Any]):
+        """
+        Lazily yield JobData items for the given criteria.
+        Routes each configured source through the dispatch table; unknown
+        sources fall through to the no-op fetcher rather than raising.
+        """
+        sources = criteria.get("sources") or self.config.sources
+        for source in sources:
+            yield from self._dispatch.get(source, self._search_noop)(criteria)
+
+    def _search_noop(self, criteria: Dict[str, Any]):
+        """Fetcher for sources with no registered implementation."""
+        return iter(())
+
+    def _search_linkedin(self, criteria: Dict[str, Any]):
+        """Yield LinkedIn results (static placeholder for now)."""
+        title = criteria.get("title") or self.config.title or "Software Engineer"
+        location = criteria.get("location") or self.config.location or "Bengaluru"
+        yield JobData(
+            job_id="demo-1",
+            title=title,
+            company="Example Corp",
+            location=location,
+            description="Build and ship features with Python.",
+            requirements=["Python", "Git", "REST"],
+            source="linkedin",
+        )
+
+    def _search_naukri(self, criteria: Dict[str, Any]):
+        """Yield Naukri results (static placeholder for now)."""
         title = criteria.get("title") or self.config.title or "Software Engineer"
         location = criteria.get("location") or self.config.location or "Bengaluru"
-        jobs = [
-            JobData(
-                job_id="demo-1",
-                title=title,
-                company="Example Corp",
-                location=location,
-                description="Build and ship features with Python.",
-                requirements=["Python", "Git", "REST"],
-                source="linkedin",
-            ),
-            JobData(
-                job_id="demo-2",
-                title=title,
-                company="Sample Labs",
-                location=location,
-                description="Data pipelines and ML ops.",
-                requirements=["SQL", "Airflow", "PySpark"],
-                source="naukri",
-            ),
-        ]
-        return jobs[: self.config.limit]
+        yield JobData(
+            job_id="demo-2",
+            title=title,
+            company="Sample Labs",
+            location=location,
+            description="Data pipelines and ML ops.",
+            requirements=["SQL", "Airflow", "PySpark"],
+            source="naukri",
+        )
@@ -19,8 +19,14 @@ class BaseAgent(ABC):
     Attributes:
         name: The name of the agent instance
         config: Configuration dictionary for the agent
+        capabilities: Task capability tags this agent can serve, used by
+            AgentManager for O(1) routing
     """
-    
+
+    __slots__ = ("name", "config")
+
+    capabilities: frozenset = frozenset()
+
     def __init__(self, name: str, config: Dict[str, Any] = None):
         """Initialize the base agent.
         
@@ -62,7 +68,11 @@ class JobAgent(BaseAgent):
     This agent coordinates job searching, application processing,
     and candidate-job matching operations.
     """
-    
+
+    __slots__ = ()
+
+    capabilities = frozenset({"job_search", "apply_to_job"})
+
     def __init__(self, name: str = "job_agent", config: Dict[str, Any] = None):
         """Initialize the job agent.
         
@@ -139,22 +149,33 @@ class AgentManager:
     This class handles agent lifecycle, task routing, and coordination
     between different types of agents in the system.
     """
-    
+
+    __slots__ = ("agents", "_by_capability", "_pending")
+
     def __init__(self):
         """Initialize the agent manager."""
         self.agents: Dict[str, BaseAgent] = {}
+        # Capability tag -> agents serving it, built at registration time so
+        # task routing is a dict lookup instead of probing every agent.
+        self._by_capability: Dict[str, List[BaseAgent]] = {}
+        # Per-agent in-flight task count, used to pick the least-loaded
+        # candidate when several agents share a capability.
+        self._pending: Dict[str, int] = {}
         # TODO: Initialize logging
         # TODO: Set up monitoring and metrics
-    
+
     def register_agent(self, agent: BaseAgent) -> None:
         """Register a new agent with the manager.
-        
+
         Args:
             agent: Agent instance to register
         """
         # TODO: Validate agent before registration
         # TODO: Check for naming conflicts
         self.agents[agent.name] = agent
+        self._pending[agent.name] = 0
+        for capability in agent.capabilities:
+            self._by_capability.setdefault(capability, []).append(agent)
     
     def get_agent(self, name: str) -> Optional[BaseAgent]:
         """Get an agent by name.
@@ -170,14 +191,33 @@ class AgentManager:
     
     def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a task using the appropriate agent.
-        
+
+        Routes via the capability index when the task carries a
+        ``capability`` tag, preferring the least-loaded candidate;
+        otherwise falls back to probing registered agents with
+        ``validate_task``.
+
         Args:
             task: Task specification dictionary
-            
+
         Returns:
             Task execution result dictionary
         """
-        # TODO: Implement task routing logic
-        # TODO: Find best agent for the task
-        # TODO: Handle task execution and error recovery
-        return {"status": "error", "message": "No suitable agent found"}
+        agent = None
+        candidates = self._by_capability.get(task.get("capability"))
+        if candidates:
+            agent = min(candidates, key=lambda a: self._pending[a.name])
+        else:
+            for candidate in self.agents.values():
+                if candidate.validate_task(task):
+                    agent = candidate
+                    break
+
+        if agent is None:
+            return {"status": "error", "message": "No suitable agent found"}
+
+        self._pending[agent.name] += 1
+        try:
+            return agent.execute(task)
+        finally:
+            self._pending[agent.name] -= 1
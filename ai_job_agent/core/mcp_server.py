@@ -8,15 +8,23 @@ interface for job searching, resume parsing, and application management.
 import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Callable
+from dataclasses import dataclass, asdict
 from abc import ABC, abstractmethod
 
+# Shared empty params mapping so the "no params" path does not allocate
+# a fresh dict per message.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True)
 class MCPMessage:
     """Represents a message in the Model Context Protocol.
-    
+
+    Slotted to avoid a per-instance ``__dict__``; the server creates two
+    of these per RPC, so instance size and field access are on the hot path.
+
     Attributes:
         id: Unique identifier for the message
         method: The method being called
@@ -37,7 +45,9 @@ class MCPHandler(ABC):
     Each handler is responsible for processing specific MCP methods
     and returning appropriate responses.
     """
-    
+
+    __slots__ = ()
+
     @abstractmethod
     async def handle(self, params: Dict[str, Any]) -> Any:
         """Handle an MCP method call.
@@ -69,7 +79,9 @@ class JobSearchHandler(MCPHandler):
     This handler processes job search requests, applies filters,
     and returns formatted job listings.
     """
-    
+
+    __slots__ = ("job_agent",)
+
     def __init__(self, job_agent):
         """Initialize the job search handler.
         
@@ -108,7 +120,9 @@ class ResumeParseHandler(MCPHandler):
     This handler processes resume documents and extracts
     structured information for job applications.
     """
-    
+
+    __slots__ = ("resume_parser",)
+
     def __init__(self, resume_parser):
         """Initialize the resume parse handler.
         
@@ -147,7 +161,9 @@ class ApplicationHandler(MCPHandler):
     This handler manages job applications, including submission,
     tracking, and status updates.
     """
-    
+
+    __slots__ = ("job_agent",)
+
     def __init__(self, job_agent):
         """Initialize the application handler.
         
@@ -186,7 +202,10 @@ class MCPServer:
     This server manages client connections, routes method calls to
     appropriate handlers, and maintains the MCP protocol compliance.
     """
-    
+
+    __slots__ = ("host", "port", "handlers", "logger", "_stop", "_server",
+                 "_caps_cache", "_bound")
+
     def __init__(self, host: str = "localhost", port: int = 8080):
         """Initialize the MCP server.
         
@@ -198,7 +217,10 @@ class MCPServer:
         self.port = port
         self.handlers: Dict[str, MCPHandler] = {}
         self.logger = logging.getLogger(__name__)
-        # TODO: Initialize connection pool
+        self._stop: Optional[asyncio.Event] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._caps_cache: Optional[Mapping[str, Any]] = None
+        self._bound: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
         # TODO: Set up SSL/TLS configuration
         # TODO: Configure authentication
     
@@ -212,6 +234,8 @@ class MCPServer:
         if method_name in self.handlers:
             self.logger.warning(f"Overriding existing handler for method: {method_name}")
         self.handlers[method_name] = handler
+        self._bound[method_name] = handler.handle
+        self._caps_cache = None
         self.logger.info(f"Registered handler for method: {method_name}")
     
     async def handle_message(self, message: MCPMessage) -> MCPMessage:
@@ -224,71 +248,135 @@ class MCPServer:
             Response MCP message
         """
         response = MCPMessage(id=message.id)
-        
+
+        # Single dict probe on the pre-bound handler table; method lookup
+        # failures are reported without paying exception-flow cost.
+        fn = self._bound.get(message.method) if message.method else None
+        if fn is None:
+            response.error = {
+                "code": -32601,  # Method not found
+                "message": f"Unknown method: {message.method}"
+            }
+            return response
+
         try:
-            if not message.method:
-                raise ValueError("Missing method in message")
-            
-            if message.method not in self.handlers:
-                raise ValueError(f"Unknown method: {message.method}")
-            
-            handler = self.handlers[message.method]
-            result = await handler.handle(message.params or {})
-            response.result = result
-            
+            response.result = await fn(message.params or _EMPTY)
         except Exception as e:
             self.logger.error(f"Error handling message {message.id}: {str(e)}")
             response.error = {
                 "code": -32603,  # Internal error
                 "message": str(e)
             }
-        
+
         return response
     
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection.
+
+        Reads newline-delimited JSON frames, routes each message through
+        `handle_message`, and writes the encoded response back.
+
+        Args:
+            reader: Stream reader for the client connection
+            writer: Stream writer for the client connection
+        """
+        peer = writer.get_extra_info("peername")
+        self.logger.debug(f"Client connected: {peer}")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    payload = json.loads(line)
+                except (json.JSONDecodeError, TypeError) as e:
+                    response = MCPMessage(id="", error={
+                        "code": -32700,  # Parse error
+                        "message": f"Invalid message frame: {e}"
+                    })
+                else:
+                    # Valid JSON that is not an object ([1,2], "x", null)
+                    # is a request-shape error, not a parse error
+                    if not isinstance(payload, dict):
+                        response = MCPMessage(id="", error={
+                            "code": -32600,  # Invalid request
+                            "message": "Message frame must be a JSON object"
+                        })
+                    else:
+                        message = MCPMessage(
+                            id=payload.get("id", ""),
+                            method=payload.get("method"),
+                            params=payload.get("params"),
+                        )
+                        response = await self.handle_message(message)
+                writer.write(json.dumps(asdict(response)).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            self.logger.debug(f"Client disconnected abruptly: {peer}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionResetError, BrokenPipeError):
+                pass
+            except asyncio.CancelledError:
+                # Server shutdown can cancel the task while it waits
+                # here; nothing follows this cleanup, so suppress the
+                # cancellation instead of surfacing it as unhandled
+                # event-loop noise.
+                pass
+
     async def start_server(self) -> None:
         """Start the MCP server.
-        
+
         Initializes the server and begins listening for client connections.
+        Blocks until `stop_server` is called.
         """
-        # TODO: Set up WebSocket or TCP server
-        # TODO: Handle client connections
-        # TODO: Implement message parsing and routing
-        # TODO: Add graceful shutdown handling
         self.logger.info(f"Starting MCP server on {self.host}:{self.port}")
-        
-        # Placeholder implementation
-        while True:
-            await asyncio.sleep(1)
-            # TODO: Replace with actual server implementation
-    
+        self._stop = asyncio.Event()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        async with self._server:
+            await self._stop.wait()
+
     async def stop_server(self) -> None:
         """Stop the MCP server gracefully.
-        
-        Closes all client connections and shuts down the server.
+
+        Closes the listening socket and unblocks `start_server`.
         """
-        # TODO: Close all client connections
-        # TODO: Clean up resources
-        # TODO: Save any pending state
         self.logger.info("Stopping MCP server")
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._stop is not None:
+            self._stop.set()
     
-    def get_capabilities(self) -> Dict[str, Any]:
+    def get_capabilities(self) -> Mapping[str, Any]:
         """Get server capabilities for MCP clients.
-        
+
+        The result is built once and cached; `register_handler` invalidates
+        the cache, so capability discovery is a dict lookup rather than a
+        fresh dict/list construction per client.
+
         Returns:
-            Dictionary describing server capabilities and available methods
+            Read-only mapping describing server capabilities and available
+            methods
         """
-        # TODO: Return actual server capabilities
         # TODO: Include available methods and their schemas
-        # TODO: Add versioning information
-        return {
-            "methods": list(self.handlers.keys()),
-            "version": "1.0.0",
-            "capabilities": {
-                "job_search": True,
-                "resume_parsing": True,
-                "job_application": True
-            }
-        }
+        if self._caps_cache is None:
+            self._caps_cache = MappingProxyType({
+                "methods": list(self.handlers.keys()),
+                "version": "1.0.0",
+                "capabilities": {
+                    "job_search": True,
+                    "resume_parsing": True,
+                    "job_application": True
+                }
+            })
+        return self._caps_cache
 
 
 async def create_mcp_server() -> MCPServer:
@@ -326,5 +414,12 @@ if __name__ == "__main__":
             await server.start_server()
         except KeyboardInterrupt:
             await server.stop_server()
-    
+
+    try:
+        # uvloop gives a ~2x throughput bump on Linux when available
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -1,10 +1,157 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import List, Optional, Dict, Any, Literal, Tuple, get_args
+from datetime import datetime, timezone
+import orjson
+import sys
+import time
+
+Status = Literal["submitted", "failed", "interview", "offer", "rejected"]
+# One interned object per status so equality checks on large histories hit
+# the pointer-comparison fast path.
+STATUSES: Dict[str, str] = {s: sys.intern(s) for s in get_args(Status)}
+# Compact integer encoding for analytics: comparisons and columnar
+# storage work on small ints while the model/wire format keeps the label.
+STATUS_LABELS: Tuple[str, ...] = get_args(Status)
+STATUS_CODES: Dict[str, int] = {label: i for i, label in enumerate(STATUS_LABELS)}
+
+# Cap on the retained status trail; long-running applications keep the
+# most recent entries instead of growing without bound.
+MAX_STATUS_UPDATES = 200
+
+class StatusUpdate(BaseModel):
+    # Value object: created, appended to the trail, never mutated. Frozen
+    # keeps instances hashable for set-based dedup across retries and
+    # skips mutation bookkeeping.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    status: Status
+    timestamp_ns: int = Field(default_factory=time.time_ns)
+    notes: str = ""
 
 class ApplicationHistory(BaseModel):
-job_id: str
-status: str # submitted, failed, interview, offer, rejected
-timestamp: datetime
-answers: Optional[Dict[str, Any]] = None
-error_reason: Optional[str] = None
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    job_id: str
+    status: Status
+    # Raw nanosecond clock read; ~10x cheaper than constructing a datetime
+    # per application. Use the `timestamp` property when a datetime is needed.
+    timestamp_ns: int = Field(default_factory=time.time_ns)
+    answers: Optional[Dict[str, Any]] = None
+    error_reason: Optional[str] = None
+    # Typed trail of transitions; tuple keeps the frozen model hashable
+    # and lets pydantic-core validate three known fields per entry rather
+    # than arbitrary dict keys.
+    status_updates: Tuple[StatusUpdate, ...] = ()
+    # Set once by with_status on the first non-submitted transition, so
+    # response-time metrics never rescan the trail.
+    first_response_ns: Optional[int] = None
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
+    @property
+    def status_code(self) -> int:
+        """Integer code for the current status (index into STATUS_LABELS)."""
+        return STATUS_CODES[self.status]
+
+    def with_status(self, status: Status, notes: str = "",
+                    now_ns: Optional[int] = None) -> "ApplicationHistory":
+        """Return a copy recording a status transition.
+
+        The model is frozen, so updates are functional; the trail is
+        truncated to the MAX_STATUS_UPDATES most recent entries before
+        appending. Bulk importers should read the clock once and pass it
+        as now_ns rather than paying a time syscall per record.
+        """
+        update = StatusUpdate(
+            status=STATUSES.get(status, status),
+            timestamp_ns=time.time_ns() if now_ns is None else now_ns,
+            notes=notes,
+        )
+        trail = self.status_updates[-(MAX_STATUS_UPDATES - 1):] + (update,)
+        changes: Dict[str, Any] = {
+            "status": update.status,
+            "status_updates": trail,
+        }
+        if self.first_response_ns is None and update.status != "submitted":
+            changes["first_response_ns"] = update.timestamp_ns
+        return self.model_copy(update=changes)
+
+    @property
+    def response_time_days(self) -> Optional[int]:
+        """Days from submission to first response, or None if unanswered.
+
+        O(1): reads the precomputed first_response_ns instead of scanning
+        status_updates on every metrics poll.
+        """
+        if self.first_response_ns is None:
+            return None
+        return int((self.first_response_ns - self.timestamp_ns) // 86_400_000_000_000)
+
+    def model_dump_json(self, **kwargs) -> str:
+        """Serialize via orjson's C encoder.
+
+        One record is written per application attempt, so the flush path
+        matters; orjson handles the nested answers dict natively and beats
+        the default serializer on both time and allocations.
+        """
+        if kwargs:
+            return super().model_dump_json(**kwargs)
+        return orjson.dumps(self.model_dump(mode="json")).decode()
+
+
+def to_columns(records: List["ApplicationHistory"]) -> Dict[str, list]:
+    """Transpose records into one list per scalar field (struct-of-arrays).
+
+    Outcome analytics scan by field, not by record; a columnar layout
+    turns those scans into tight list traversals, and the dict feeds
+    pyarrow.RecordBatch.from_arrays / polars directly when those are
+    installed without making them dependencies here.
+    """
+    columns: Dict[str, list] = {
+        "job_id": [],
+        "status_code": [],
+        "timestamp_ns": [],
+        "first_response_ns": [],
+        "response_time_days": [],
+        "error_reason": [],
+    }
+    append_job_id = columns["job_id"].append
+    append_status = columns["status_code"].append
+    append_ts = columns["timestamp_ns"].append
+    append_first = columns["first_response_ns"].append
+    append_days = columns["response_time_days"].append
+    append_err = columns["error_reason"].append
+    for record in records:
+        append_job_id(record.job_id)
+        append_status(STATUS_CODES[record.status])
+        append_ts(record.timestamp_ns)
+        append_first(record.first_response_ns)
+        append_days(record.response_time_days)
+        append_err(record.error_reason)
+    return columns
+
+
+def dump_history(records: List["ApplicationHistory"]) -> bytes:
+    """Bulk-encode application records to a JSON array with orjson."""
+    return orjson.dumps([r.model_dump(mode="json") for r in records])
+
+
+# Module-level adapter so bulk loads parse JSON and validate every record
+# inside pydantic-core in one pass, instead of json.loads + a per-item
+# model constructor loop.
+APPLICATION_HISTORY_LIST = TypeAdapter(List[ApplicationHistory])
+
+
+def load_history(blob: bytes) -> List[ApplicationHistory]:
+    """Bulk-decode a JSON array of application records."""
+    return APPLICATION_HISTORY_LIST.validate_json(blob)
+
+
+# Force validator/serializer construction at import time: pydantic-core
+# builds them lazily on first use, which would otherwise put a warmup
+# spike on the first application submitted by each worker process.
+ApplicationHistory.model_rebuild()
+StatusUpdate.model_rebuild()
+_ = APPLICATION_HISTORY_LIST.core_schema
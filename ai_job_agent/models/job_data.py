@@ -1,12 +1,92 @@
-from pydantic import BaseModel, HttpUrl
-from typing import List, Optional
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Dict, List, NamedTuple, Optional, Tuple, Literal, get_args
+import orjson
+import sys
+
+Source = Literal["linkedin", "naukri", "indeed"]
+
+class JobSkillsView(NamedTuple):
+    """Lightweight projection of the fields the match-score path reads.
+
+    Scoring loops over many jobs but touches only these columns; the
+    NamedTuple avoids dragging full model instances through the loop.
+    """
+    job_id: str
+    requirements: Tuple[str, ...]
+    description: Optional[str]
+
+SOURCES: Dict[str, str] = {s: sys.intern(s) for s in get_args(Source)}
 
 class JobData(BaseModel):
-job_id: str
-title: str
-company: str
-location: Optional[str] = None
-description: Optional[str] = None
-requirements: List[str] = []
-apply_url: Optional[HttpUrl] = None
-source: Optional[str] = None # linkedin, naukri
+    # Deliberately flat: company/salary details stay scalar fields rather
+    # than nested sub-models, so bulk ingest runs one validator per job
+    # instead of one per nested object.
+    # Frozen + extra-forbid keeps instances immutable/hashable and skips
+    # __dict__-mutation bookkeeping; search results are built in bulk and
+    # never modified afterwards.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    job_id: str
+    title: str
+    company: str
+    location: Optional[str] = None
+    description: Optional[str] = None
+    requirements: Tuple[str, ...] = ()
+    # Kept as a plain str: HttpUrl validation is expensive and the URL is
+    # only dereferenced for the handful of jobs actually applied to.
+    apply_url: Optional[str] = None
+    source: Optional[Source] = None
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, object]) -> "JobData":
+        """Build a JobData from pre-validated data, skipping validation.
+
+        Only for rows that already passed validation once (local DB or
+        cache hits); model_construct is 10-50x cheaper than the normal
+        constructor. External JSON must keep going through __init__.
+        """
+        return cls.model_construct(**data)
+
+    def model_dump_json(self, **kwargs) -> str:
+        """Serialize via orjson's C encoder (stock path for format kwargs)."""
+        if kwargs:
+            return super().model_dump_json(**kwargs)
+        return orjson.dumps(self.model_dump(mode="json")).decode()
+
+    @classmethod
+    def parse_many(cls, raw: bytes) -> List["JobData"]:
+        """Validate a JSON array of jobs through the shared list adapter."""
+        return JOB_LIST_ADAPTER.validate_json(raw)
+
+    @classmethod
+    def validate_batch(cls, raw: List[dict]) -> List["JobData"]:
+        """Validate a batch of already-parsed dicts in one pydantic-core call.
+
+        One FFI crossing for the whole batch instead of one per row, for
+        scrapers that hand over lists of raw dicts rather than JSON bytes.
+        """
+        return JOB_LIST_ADAPTER.validate_python(raw)
+
+    def skills_view(self) -> JobSkillsView:
+        """Project the scoring-relevant columns into a JobSkillsView."""
+        return JobSkillsView(self.job_id, self.requirements, self.description)
+
+    @cached_property
+    def dedup_key(self) -> Tuple[str, str]:
+        """Casefolded (title, company) pair, computed once per instance.
+
+        Cross-platform dedup probes this key for every job; caching it
+        avoids re-casefolding the same strings on each comparison.
+        """
+        return (self.title.casefold(), self.company.casefold())
+
+
+# Built once at import: constructing TypeAdapter(List[JobData]) per batch
+# would rebuild the core schema on every scrape.
+JOB_LIST_ADAPTER = TypeAdapter(List[JobData])
+
+
+def dump_many(items: List[JobData]) -> bytes:
+    """Encode a list of jobs to a JSON array via the shared adapter."""
+    return JOB_LIST_ADAPTER.dump_json(items)
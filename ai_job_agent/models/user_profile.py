@@ -1,27 +1,88 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import List, Optional
-
-class Experience(BaseModel):
-company: str
-title: str
-start_date: Optional[str] = None
-end_date: Optional[str] = None
-summary: Optional[str] = None
-technologies: List[str] = []
-
-class Education(BaseModel):
-institution: str
-degree: Optional[str] = None
-start_year: Optional[int] = None
-end_year: Optional[int] = None
-
-class UserProfile(BaseModel):
-full_name: str
-email: EmailStr
-phone: Optional[str] = None
-location: Optional[str] = None
-skills: List[str] = []
-experience: List[Experience] = []
-education: List[Education] = []
-linkedin_url: Optional[str] = None
-naukri_url: Optional[str] = None
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Optional, Tuple
+
+# The profile is loaded once per process and read constantly afterwards,
+# so the resident representation is a slotted dataclass (no __dict__, no
+# per-read pydantic machinery); validation happens exactly once at the
+# loading boundary via UserProfileIn.
+
+@dataclass(slots=True)
+class Experience:
+    company: str
+    title: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    summary: Optional[str] = None
+    technologies: Tuple[str, ...] = ()
+
+@dataclass(slots=True)
+class Education:
+    institution: str
+    degree: Optional[str] = None
+    start_year: Optional[int] = None
+    end_year: Optional[int] = None
+
+@dataclass(slots=True)
+class UserProfile:
+    full_name: str
+    # Plain str: the address is validated once at the loading boundary.
+    email: str
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    skills: Tuple[str, ...] = ()
+    experience: Tuple[Experience, ...] = ()
+    education: Tuple[Education, ...] = ()
+    linkedin_url: Optional[str] = None
+    naukri_url: Optional[str] = None
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, object]) -> "UserProfile":
+        """Build a UserProfile from pre-validated data, skipping validation.
+
+        Reserved for reloads of data this process (or the config loader)
+        already validated; nested experience/education rows become their
+        dataclasses directly, with no validator anywhere in the tree.
+        """
+        data = dict(data)
+        data["experience"] = tuple(
+            Experience(**row) for row in data.get("experience", ())
+        )
+        data["education"] = tuple(
+            Education(**row) for row in data.get("education", ())
+        )
+        return cls(**data)
+
+class UserProfileIn(BaseModel):
+    """Validating boundary model for profile ingestion.
+
+    Used only where profile data enters the system (config files, resume
+    parsing); everything downstream works with the slotted UserProfile
+    dataclass produced by to_profile().
+    """
+
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
+    full_name: str
+    email: str
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    skills: Tuple[str, ...] = ()
+    experience: Tuple[Experience, ...] = ()
+    education: Tuple[Education, ...] = ()
+    linkedin_url: Optional[str] = None
+    naukri_url: Optional[str] = None
+
+    def to_profile(self) -> UserProfile:
+        """Produce the plain dataclass used by all downstream code."""
+        return UserProfile(
+            full_name=self.full_name,
+            email=self.email,
+            phone=self.phone,
+            location=self.location,
+            skills=tuple(self.skills),
+            experience=tuple(self.experience),
+            education=tuple(self.education),
+            linkedin_url=self.linkedin_url,
+            naukri_url=self.naukri_url,
+        )
@@ -1,11 +1,47 @@
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-import time
-from selenium import webdriver
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from .base_platform import BasePlatform
+from ..utils.ttl_cache import TTLCache
+
+
+def wait_for(driver, locator, timeout=10, poll=0.25):
+    """
+    Wait until an element is present, polling every `poll` seconds.
+
+    Returns as soon as the element appears (often 200-500ms) instead of
+    paying a fixed worst-case sleep; stale/missing elements during the
+    poll are retried rather than raised.
+
+    Args:
+        driver: WebDriver instance
+        locator: (By, value) tuple
+        timeout: Maximum seconds to wait
+        poll: Poll interval in seconds
+
+    Returns:
+        WebElement, or None if the element never appeared
+    """
+    wait = WebDriverWait(
+        driver, timeout, poll_frequency=poll,
+        ignored_exceptions=(StaleElementReferenceException,
+                            NoSuchElementException),
+    )
+    try:
+        return wait.until(EC.presence_of_element_located(locator))
+    except TimeoutException:
+        return None
 
 
 class LinkedInBot(BasePlatform):
@@ -24,8 +60,14 @@ class LinkedInBot(BasePlatform):
         super().__init__(config)
         self.base_url = "https://www.linkedin.com"
         self.driver = None
+        self.driver_manager = None
         self.wait_timeout = config.get('wait_timeout', 10)
         self.search_delay = config.get('search_delay', 2)
+        # Job details are stable over short windows; re-lookups within the
+        # crawl (re-scoring, cross-platform dedup) hit this map instead of
+        # the network.
+        self._details_cache = TTLCache(maxsize=config.get('cache_maxsize', 2048))
+        self._details_ttl = config.get('details_ttl', 600)
     
     def authenticate(self, credentials: Dict[str, str]) -> bool:
         """
@@ -38,18 +80,45 @@ class LinkedInBot(BasePlatform):
             bool: True if authentication successful, False otherwise
         """
         try:
-            # Initialize webdriver
-            self.driver = webdriver.Chrome()  # TODO: Configure driver options
-            self.driver.get(f"{self.base_url}/login")
-            
-            # TODO: Implement login logic
-            # - Find email/username field
-            # - Find password field 
-            # - Handle CAPTCHA if present
-            # - Handle 2FA if enabled
-            # - Check for successful login indicators
-            
-            self.is_authenticated = False  # Placeholder
+            # Cookie-based Voyager auth over plain HTTPS; no browser needed
+            # until an Easy-Apply form submission requires one.
+            session = requests.Session()
+            # Keep-alive pool sized for the batched detail fetches: TLS is
+            # negotiated once per connection and reused, instead of paying
+            # a fresh handshake per Voyager call.
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            )
+            session.mount('https://', adapter)
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64)',
+                'x-restli-protocol-version': '2.0.0',
+            })
+            session.post(
+                f"{self.base_url}/checkpoint/lg/login-submit",
+                data={
+                    'session_key': credentials.get('email', ''),
+                    'session_password': credentials.get('password', ''),
+                },
+                timeout=self.wait_timeout,
+            )
+            # TODO: Handle CAPTCHA / 2FA checkpoint responses
+
+            if 'li_at' not in session.cookies:
+                self.is_authenticated = False
+                return False
+
+            # Voyager requires the JSESSIONID cookie echoed as csrf-token
+            session.headers['csrf-token'] = session.cookies.get(
+                'JSESSIONID', '').strip('"')
+            self.session = session
+            self.is_authenticated = True
             return self.is_authenticated
             
         except Exception as e:
@@ -70,35 +139,53 @@ class LinkedInBot(BasePlatform):
         """
         if not self.is_authenticated:
             raise Exception("Must authenticate before searching jobs")
-        
-        jobs = []
-        
+
+        filters = filters or {}
+
         try:
-            # TODO: Implement job search logic
-            # - Navigate to jobs search page
-            # - Enter search query
-            # - Apply filters (location, experience, job type, etc.)
-            # - Scroll through search results
-            # - Extract job information from each listing
-            # - Handle pagination
-            
-            # Standardized job structure:
-            job_template = {
-                'id': '',  # Unique LinkedIn job ID
-                'title': '',  # Job title
-                'company': '',  # Company name
-                'location': '',  # Job location
-                'description': '',  # Job description snippet
-                'posted_date': '',  # When job was posted
-                'application_deadline': '',  # Application deadline if available
-                'salary_range': '',  # Salary information if available
-                'experience_level': '',  # Entry, Mid, Senior level
-                'job_type': '',  # Full-time, Part-time, Contract, etc.
-                'url': '',  # Direct URL to job posting
-                'easy_apply': False,  # Whether job has easy apply option
+            # Voyager returns the same data the rendered page shows, as one
+            # JSON response; no browser, no scrolling, no HTML parsing.
+            params = {
+                'q': 'jserpFilters',
+                'keywords': query,
+                'start': filters.get('start', 0),
+                'count': filters.get('count', 25),
             }
-            
-            # Placeholder - return empty list
+            if filters.get('location'):
+                params['location'] = filters['location']
+
+            resp = self.session.get(
+                f"{self.base_url}/voyager/api/search/hits",
+                params=params,
+                timeout=self.wait_timeout,
+            )
+            resp.raise_for_status()
+            payload = orjson.loads(resp.content)
+
+            jobs = []
+            for hit in payload.get('elements', []):
+                posting = hit.get('jobPosting') or hit.get('hitInfo', {}).get(
+                    'com.linkedin.voyager.search.SearchJobJserp', {}
+                ).get('jobPosting', {})
+                if not posting:
+                    continue
+                job_id = str(posting.get('id', ''))
+                # Standardized job structure:
+                jobs.append({
+                    'id': job_id,  # Unique LinkedIn job ID
+                    'title': posting.get('title', ''),
+                    'company': posting.get('companyName', ''),
+                    'location': posting.get('formattedLocation', ''),
+                    'description': posting.get('descriptionSnippet', ''),
+                    'posted_date': str(posting.get('listedAt', '')),
+                    'application_deadline': '',
+                    'salary_range': '',
+                    'experience_level': posting.get('formattedExperienceLevel', ''),
+                    'job_type': posting.get('employmentStatus', ''),
+                    'url': f"{self.base_url}/jobs/view/{job_id}" if job_id else '',
+                    'easy_apply': bool(posting.get('applyMethod', {}).get(
+                        'com.linkedin.voyager.jobs.SimpleOnsiteApply')),
+                })
             return jobs
             
         except Exception as e:
@@ -117,50 +204,96 @@ class LinkedInBot(BasePlatform):
         """
         if not self.is_authenticated:
             raise Exception("Must authenticate before getting job details")
-        
+
+        cached = self._details_cache.get(job_id)
+        if cached is not None:
+            return cached
+
         try:
-            # TODO: Implement job details extraction
-            # - Navigate to specific job posting URL
-            # - Extract complete job description
-            # - Extract requirements and qualifications
-            # - Extract benefits and perks
-            # - Extract company information
-            # - Extract application instructions
-            
+            resp = self.session.get(
+                f"{self.base_url}/voyager/api/jobs/jobPostings/{job_id}",
+                timeout=self.wait_timeout,
+            )
+            resp.raise_for_status()
+            posting = orjson.loads(resp.content)
+
             job_details = {
                 'id': job_id,
-                'title': '',
-                'company': '',
+                'title': posting.get('title', ''),
+                'company': posting.get('companyDetails', {}).get('companyName', ''),
                 'company_info': {
-                    'name': '',
+                    'name': posting.get('companyDetails', {}).get('companyName', ''),
                     'size': '',
                     'industry': '',
                     'location': '',
                     'description': '',
                 },
                 'job_info': {
-                    'location': '',
-                    'job_type': '',
-                    'experience_level': '',
+                    'location': posting.get('formattedLocation', ''),
+                    'job_type': posting.get('employmentStatus', ''),
+                    'experience_level': posting.get('formattedExperienceLevel', ''),
                     'salary_range': '',
-                    'posted_date': '',
+                    'posted_date': str(posting.get('listedAt', '')),
                     'application_deadline': '',
                 },
-                'description': '',
+                'description': posting.get('description', {}).get('text', ''),
                 'requirements': [],
                 'responsibilities': [],
                 'benefits': [],
                 'skills': [],
-                'application_url': '',
-                'easy_apply_available': False,
+                'application_url': posting.get('applyMethod', {}).get(
+                    'companyApplyUrl', ''),
+                'easy_apply_available': bool(posting.get('applyMethod', {}).get(
+                    'com.linkedin.voyager.jobs.SimpleOnsiteApply')),
             }
             
+            self._details_cache.set(job_id, job_details, self._details_ttl)
             return job_details
             
         except Exception as e:
             print(f"Failed to get job details for {job_id}: {e}")
             return {}
     
+    def get_job_details_batch(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch details for many jobs concurrently.
+
+        Voyager detail lookups are independent HTTP GETs, so they are
+        fanned out over a thread pool sharing the pooled session; wall
+        time is bounded by LinkedIn rate limits rather than sequential
+        round-trips.
+
+        Args:
+            job_ids: LinkedIn job IDs to fetch
+
+        Returns:
+            List of job detail dictionaries, in job_ids order
+        """
+        max_workers = self.config.get('detail_concurrency', 8)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.get_job_details, job_ids))
+
+    def _get_driver(self):
+        """
+        Return the shared WebDriver, starting one lazily on first use.
+
+        Chrome cold-starts cost 1-2s each; one session is reused across
+        Easy-Apply submissions, with cookies cleared between jobs instead
+        of quitting. The driver is only torn down in logout().
+
+        Returns:
+            WebDriver instance, or None if the driver could not start
+        """
+        if self.driver is not None and getattr(self.driver, 'session_id', None):
+            return self.driver
+
+        from ..utils.web_driver import WebDriverManager
+
+        self.driver_manager = WebDriverManager(timeout=self.wait_timeout)
+        if self.driver_manager.start_driver():
+            self.driver = self.driver_manager.driver
+        return self.driver
+
     def apply_to_job(self, job_id: str, application_data: Dict[str, Any]) -> bool:
         """
         Apply to a specific job on LinkedIn.
@@ -181,9 +314,19 @@ class LinkedInBot(BasePlatform):
             raise Exception("Must authenticate before applying to jobs")
         
         try:
+            driver = self._get_driver()
+            if driver is None:
+                return False
+
+            driver.get(f"{self.base_url}/jobs/view/{job_id}")
+            apply_button = wait_for(
+                driver, (By.CLASS_NAME, 'jobs-apply-button'),
+                timeout=self.wait_timeout,
+            )
+            if apply_button is None:
+                return False
+
             # TODO: Implement job application logic
-            # - Navigate to job posting
-            # - Check if easy apply is available
             # - Click apply button
             # - Fill out application form
             # - Upload resume if required
@@ -196,6 +339,11 @@ class LinkedInBot(BasePlatform):
         except Exception as e:
             print(f"Failed to apply to job {job_id}: {e}")
             return False
+        finally:
+            # Reset session state between jobs; quitting here would pay
+            # the cold-start cost again on the next application.
+            if self.driver is not None:
+                self.driver.delete_all_cookies()
     
     def get_application_status(self, application_id: str) -> str:
         """
@@ -264,7 +412,12 @@ class LinkedInBot(BasePlatform):
             bool: True if logout successful
         """
         try:
-            if self.driver:
+            self._details_cache.clear()
+            if self.driver_manager is not None:
+                self.driver_manager.stop_driver()
+                self.driver_manager = None
+                self.driver = None
+            elif self.driver:
                 self.driver.quit()
                 self.driver = None
             
@@ -1,11 +1,120 @@
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 import requests
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+from lxml import html as lxml_html
+from ai_job_agent.utils.ttl_cache import TTLCache
 from .base_platform import BasePlatform
+import copy
+import hashlib
+import orjson
+
+# One shared session for all Naukri HTTP traffic: keep-alive reuse
+# amortizes the TLS handshake to ~0 after the first request, and the
+# adapter retries transient upstream failures with backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64)'})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+
+# Selenium locators for browser-driven flows, built once. By.* constants
+# are plain strings; spelling them out keeps the selenium import lazy so
+# pure-REST users never load it.
+_LOCATORS = {
+    'email_field': ('id', 'usernameField'),
+    'password_field': ('id', 'passwordField'),
+    'login_button': ('xpath', "//button[@type='submit']"),
+}
+
+# Precompiled XPaths for listing-page parsing: compilation is the
+# expensive step, executing a compiled XPath object is C-level.
+_XP_JOB_TUPLES = etree.XPath('//article[contains(@class, "jobTuple")]')
+_XP_ID = etree.XPath('string(./@data-job-id)')
+_XP_TITLE = etree.XPath('string(.//a[contains(@class, "title")])')
+_XP_COMPANY = etree.XPath(
+    'string(.//a[contains(@class, "comp-name") or contains(@class, "subTitle")])')
+_XP_LOCATION = etree.XPath('string(.//*[contains(@class, "location")])')
+_XP_EXPERIENCE = etree.XPath(
+    'string(.//*[contains(@class, "experience") or contains(@class, "expwdth")])')
+_XP_SALARY = etree.XPath('string(.//*[contains(@class, "salary")])')
+_XP_SKILLS = etree.XPath('.//*[contains(@class, "tag")]/text()')
+_XP_DESCRIPTION = etree.XPath(
+    'string(.//*[contains(@class, "job-desc") or contains(@class, "job-description")])')
+_XP_POSTED = etree.XPath(
+    'string(.//*[contains(@class, "job-post-day") or contains(@class, "postedDate")])')
+_XP_RATING = etree.XPath('string(.//*[contains(@class, "rating")])')
+_XP_URL = etree.XPath('string(.//a[contains(@class, "title")]/@href)')
+
+# Standardized listing-row schema, shared by the API and HTML paths.
+# Rows copy() this template; mutable fields are always reassigned per row.
+_JOB_TEMPLATE = {
+    'id': '',  # Naukri job ID
+    'title': '',
+    'company': '',
+    'company_type': '',  # MNC, Indian, Startup, etc.
+    'location': '',
+    'experience': '',  # Experience requirement (e.g., "2-5 years")
+    'salary': '',
+    'skills': (),
+    'description': '',
+    'posted_date': '',
+    'applications_count': '',
+    'company_rating': '',
+    'url': '',
+    'instant_apply': False,
+}
+
+# Standardized detail-page schema, built once; per-call construction of
+# this nested literal re-hashes every key on a path that runs per job.
+_JOB_DETAILS_TEMPLATE = {
+    'id': '',  # Naukri job ID
+    'title': '',
+    'company': '',
+    'company_info': {
+        'name': '',
+        'type': '',  # MNC, Indian, Startup
+        'size': '',
+        'location': '',
+        'industry': '',
+        'website': '',
+        'rating': '',
+    },
+    'job_info': {
+        'location': '',
+        'experience': '',
+        'salary': '',
+        'employment_type': '',  # Full Time, Part Time, Contractual
+        'role_category': '',
+        'industry': '',
+        'posted_date': '',
+    },
+    'description': '',
+    'key_skills': [],
+    'requirements': {
+        'education': '',
+        'experience_details': '',
+        'mandatory_skills': [],
+        'preferred_skills': [],
+    },
+    'benefits': [],
+    'application_info': {
+        'applications_count': '',
+        'instant_apply_available': False,
+        'recruiter_info': '',
+    },
+    'url': '',
+}
+
 
 
 class NaukriBot(BasePlatform):
@@ -23,10 +132,19 @@ class NaukriBot(BasePlatform):
         """
         super().__init__(config)
         self.base_url = "https://www.naukri.com"
-        self.driver = None
         self.wait_timeout = config.get('wait_timeout', 10)
+        # One shared browser per bot, created lazily in authenticate so the
+        # REST-only paths never pay the selenium import or Chrome spawn.
+        self.driver_manager = None
+        self.driver = None
         self.search_delay = config.get('search_delay', 2)
         self.profile_completion_check = config.get('profile_completion_check', True)
+        # Naukri data changes on the order of hours; cache keyed fetches so
+        # repeat lookups skip the page-load round-trip entirely.
+        self._cache = TTLCache(maxsize=config.get('cache_maxsize', 1024))
+        self._job_ttl = config.get('job_ttl', 3600)
+        self._salary_ttl = config.get('salary_ttl', 24 * 3600)
+        self._recommended_ttl = config.get('recommended_ttl', 15 * 60)
     
     def authenticate(self, credentials: Dict[str, str]) -> bool:
         """
@@ -39,9 +157,19 @@ class NaukriBot(BasePlatform):
             bool: True if authentication successful, False otherwise
         """
         try:
-            # Initialize webdriver
-            self.driver = webdriver.Chrome()  # TODO: Configure driver options
-            self.driver.get(f"{self.base_url}/nlogin/login")
+            # Reuse the managed driver; only start it on first authenticate.
+            # selenium (~100ms, ~15MB) is imported here, not at module load.
+            if self.driver is None:
+                from ai_job_agent.utils.web_driver import WebDriverManager
+                if self.driver_manager is None:
+                    self.driver_manager = WebDriverManager(
+                        headless=self.config.get('headless', True),
+                        timeout=self.wait_timeout,
+                    )
+                if not self.driver_manager.start_driver():
+                    return False
+                self.driver = self.driver_manager.driver
+            self.driver_manager.navigate_to(f"{self.base_url}/nlogin/login")
             
             # TODO: Implement login logic
             # - Find email/mobile field
@@ -71,45 +199,141 @@ class NaukriBot(BasePlatform):
         """
         if not self.is_authenticated:
             raise Exception("Must authenticate before searching jobs")
-        
-        jobs = []
-        
+
         try:
-            # TODO: Implement job search logic
-            # - Navigate to jobs search page
-            # - Enter search query in skill/designation field
-            # - Apply location filters
-            # - Apply experience filters
-            # - Apply salary range filters
-            # - Apply company type filters (MNC, Indian, Startup, etc.)
-            # - Apply industry filters
-            # - Handle search results pagination
-            # - Extract job information from listings
-            
+            # Naukri's internal JSON API returns the same rows the DOM
+            # renders; one compressed response replaces a page render plus
+            # dozens of XPath queries.
+            return self._search_via_api(query, filters)
+        except Exception as e:
+            print(f"API job search failed, falling back to HTML: {e}")
+
+        try:
+            # Listing pages are mostly static HTML; fetching them directly
+            # and parsing with lxml avoids spinning the browser for a SERP.
+            url = self._build_search_url(query, filters)
+            resp = _SESSION.get(url, timeout=self.wait_timeout)
+            resp.raise_for_status()
+            return self._parse_listing_page(resp.content)
+
+        except Exception as e:
+            print(f"Job search failed: {e}")
+            return []
+
+    def _search_via_api(self, query: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Query Naukri's internal search API and map rows into job dicts.
+
+        Args:
+            query: Job search query string
+            filters: Optional filters ('location', 'experience', 'limit', 'page')
+
+        Returns:
+            List of job dictionaries with standardized structure
+        """
+        filters = filters or {}
+        params = {
+            'keyword': query,
+            'noOfResults': filters.get('limit', 100),
+            'pageNo': filters.get('page', 1),
+            'urlType': 'search_by_keyword',
+            'searchType': 'adv',
+        }
+        if filters.get('location'):
+            params['location'] = filters['location']
+        if filters.get('experience') is not None:
+            params['experience'] = filters['experience']
+
+        resp = _SESSION.get(
+            f"{self.base_url}/jobapi/v3/search",
+            params=params,
+            headers={'appid': '109', 'systemid': 'Naukri'},
+            timeout=self.wait_timeout,
+        )
+        resp.raise_for_status()
+        payload = orjson.loads(resp.content)
+
+        jobs = []
+        for row in payload.get('jobDetails', []):
+            placeholders = {
+                p.get('type'): p.get('label', '')
+                for p in row.get('placeholders', [])
+            }
+            job = _JOB_TEMPLATE.copy()
+            job['id'] = str(row.get('jobId', ''))
+            job['title'] = row.get('title', '')
+            job['company'] = row.get('companyName', '')
+            job['location'] = placeholders.get('location', '')
+            job['experience'] = placeholders.get('experience', '')
+            job['salary'] = placeholders.get('salary', '')
+            job['skills'] = [
+                t for t in row.get('tagsAndSkills', '').split(',') if t
+            ]
+            job['description'] = row.get('jobDescription', '')
+            job['posted_date'] = row.get('footerPlaceholderLabel', '')
+            job['url'] = row.get('jdURL', '')
+            jobs.append(job)
+        return jobs
+
+    def _build_search_url(self, query: str, filters: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a Naukri search URL from a query and optional filters.
+
+        Args:
+            query: Job search query string
+            filters: Optional filters ('location', 'experience', 'salary')
+
+        Returns:
+            str: Fully qualified search URL
+        """
+        filters = filters or {}
+        slug = '-'.join(query.lower().split())
+        if filters.get('location'):
+            location_slug = '-'.join(str(filters['location']).lower().split())
+            path = f"/{slug}-jobs-in-{location_slug}"
+        else:
+            path = f"/{slug}-jobs"
+        params = {}
+        if filters.get('experience') is not None:
+            params['experience'] = filters['experience']
+        if filters.get('salary') is not None:
+            params['ctcFilter'] = filters['salary']
+        if params:
+            return f"{self.base_url}{path}?{urlencode(params)}"
+        return f"{self.base_url}{path}"
+
+    def _parse_listing_page(self, content: bytes) -> List[Dict[str, Any]]:
+        """
+        Parse a Naukri search results page into standardized job dicts.
+
+        Args:
+            content: Raw HTML bytes of the listing page
+
+        Returns:
+            List of job dictionaries with standardized structure
+        """
+        tree = lxml_html.fromstring(content)
+        jobs = []
+        for tuple_el in _XP_JOB_TUPLES(tree):
             # Standardized job structure for Naukri:
-            job_template = {
-                'id': '',  # Naukri job ID
-                'title': '',  # Job title
-                'company': '',  # Company name
+            job = {
+                'id': _XP_ID(tuple_el).strip(),  # Naukri job ID
+                'title': _XP_TITLE(tuple_el).strip(),
+                'company': _XP_COMPANY(tuple_el).strip(),
                 'company_type': '',  # MNC, Indian, Startup, etc.
-                'location': '',  # Job location
-                'experience': '',  # Experience requirement (e.g., "2-5 years")
-                'salary': '',  # Salary range
-                'skills': [],  # Required skills
-                'description': '',  # Job description snippet
-                'posted_date': '',  # When job was posted
+                'location': _XP_LOCATION(tuple_el).strip(),
+                'experience': _XP_EXPERIENCE(tuple_el).strip(),
+                'salary': _XP_SALARY(tuple_el).strip(),
+                'skills': [t.strip() for t in _XP_SKILLS(tuple_el) if t.strip()],
+                'description': _XP_DESCRIPTION(tuple_el).strip(),
+                'posted_date': _XP_POSTED(tuple_el).strip(),
                 'applications_count': '',  # Number of applications
-                'company_rating': '',  # Company rating if available
-                'url': '',  # Direct URL to job posting
+                'company_rating': _XP_RATING(tuple_el).strip(),
+                'url': _XP_URL(tuple_el).strip(),
                 'instant_apply': False,  # Whether job supports instant apply
             }
-            
-            # Placeholder - return empty list
-            return jobs
-            
-        except Exception as e:
-            print(f"Job search failed: {e}")
-            return []
+            jobs.append(job)
+        return jobs
     
     def get_job_details(self, job_id: str) -> Dict[str, Any]:
         """
@@ -123,7 +347,12 @@ class NaukriBot(BasePlatform):
         """
         if not self.is_authenticated:
             raise Exception("Must authenticate before getting job details")
-        
+
+        cache_key = f"naukri:job:{job_id}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # TODO: Implement job details extraction
             # - Navigate to specific job posting URL
@@ -134,51 +363,37 @@ class NaukriBot(BasePlatform):
             # - Extract education requirements
             # - Extract company details and benefits
             
-            job_details = {
-                'id': job_id,
-                'title': '',
-                'company': '',
-                'company_info': {
-                    'name': '',
-                    'type': '',  # MNC, Indian, Startup
-                    'size': '',
-                    'location': '',
-                    'industry': '',
-                    'website': '',
-                    'rating': '',
-                },
-                'job_info': {
-                    'location': '',
-                    'experience': '',
-                    'salary': '',
-                    'employment_type': '',  # Full Time, Part Time, Contractual
-                    'role_category': '',
-                    'industry': '',
-                    'posted_date': '',
-                },
-                'description': '',
-                'key_skills': [],
-                'requirements': {
-                    'education': '',
-                    'experience_details': '',
-                    'mandatory_skills': [],
-                    'preferred_skills': [],
-                },
-                'benefits': [],
-                'application_info': {
-                    'applications_count': '',
-                    'instant_apply_available': False,
-                    'recruiter_info': '',
-                },
-                'url': '',
-            }
-            
+            job_details = copy.deepcopy(_JOB_DETAILS_TEMPLATE)
+            job_details['id'] = job_id
+
+            self._cache.set(cache_key, job_details, self._job_ttl)
             return job_details
-            
+
         except Exception as e:
             print(f"Failed to get job details for {job_id}: {e}")
             return {}
-    
+
+    def get_job_details_bulk(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch details for many jobs with a bounded number in flight at once.
+
+        Sequential per-listing fetches serialize network RTT; overlapping
+        them gives near-linear speedup up to the site's rate limit. The
+        concurrency bound comes from config['detail_concurrency'].
+
+        Args:
+            job_ids: Naukri job IDs to fetch
+
+        Returns:
+            List of job detail dictionaries, in the same order as job_ids
+        """
+        if not self.is_authenticated:
+            raise Exception("Must authenticate before getting job details")
+
+        concurrency = self.config.get('detail_concurrency', 8)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(self.get_job_details, job_ids))
+
     def apply_to_job(self, job_id: str, application_data: Dict[str, Any]) -> bool:
         """
         Apply to a specific job on Naukri.com.
@@ -280,8 +495,15 @@ class NaukriBot(BasePlatform):
         Returns:
             List of recommended job dictionaries
         """
+        cache_key = f"naukri:recs:{self.config.get('user_id', 'default')}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # TODO: Implement recommended jobs retrieval
-        return []
+        recommended = []
+        self._cache.set(cache_key, recommended, self._recommended_ttl)
+        return recommended
     
     def get_salary_insights(self, job_title: str, location: str) -> Dict[str, Any]:
         """
@@ -294,13 +516,21 @@ class NaukriBot(BasePlatform):
         Returns:
             Dictionary containing salary insights
         """
+        digest = hashlib.sha1(f"{job_title}|{location}".encode()).hexdigest()
+        cache_key = f"naukri:salary:{digest}"
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # TODO: Implement salary insights retrieval
-        return {
+        insights = {
             'min_salary': '',
             'max_salary': '',
             'average_salary': '',
             'percentiles': {},
         }
+        self._cache.set(cache_key, insights, self._salary_ttl)
+        return insights
     
     def logout(self) -> bool:
         """
@@ -310,10 +540,10 @@ class NaukriBot(BasePlatform):
             bool: True if logout successful
         """
         try:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
-            
+            if self.driver_manager is not None:
+                self.driver_manager.stop_driver()
+            self.driver = None
+
             return super().logout()
             
         except Exception as e:
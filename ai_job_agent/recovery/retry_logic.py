@@ -3,13 +3,46 @@
 Provides robust retry mechanisms with exponential backoff and jitter.
 """
 
+import asyncio
+import sqlite3
+import threading
 import time
 import random
 import logging
 from typing import Any, Callable, Optional, Union, Type, List
-from functools import wraps
+from functools import lru_cache, wraps
 from dataclasses import dataclass
 from enum import Enum
+from urllib.error import URLError
+
+try:
+    import requests
+    _REQUESTS_RETRYABLE = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.HTTPError,
+    )
+    _REQUESTS_NON_RETRYABLE = (
+        requests.exceptions.HTTPError,  # Client errors (4xx) shouldn't be retried
+    )
+except ImportError:
+    _REQUESTS_RETRYABLE = ()
+    _REQUESTS_NON_RETRYABLE = ()
+
+# Exception groups resolved once at module load; the convenience
+# decorators below reference these instead of importing inside their
+# bodies on every decoration.
+_NETWORK_RETRYABLE = _REQUESTS_RETRYABLE + (
+    URLError,
+    OSError,  # Network-related OS errors
+)
+_DB_RETRYABLE = (
+    sqlite3.OperationalError,
+    sqlite3.DatabaseError,
+)
+_DB_NON_RETRYABLE = (
+    sqlite3.IntegrityError,  # Don't retry on constraint violations
+)
 
 
 class RetryStrategy(Enum):
@@ -20,9 +53,14 @@ class RetryStrategy(Enum):
     FIBONACCI_BACKOFF = "fibonacci_backoff"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
-    """Configuration for retry behavior."""
+    """Configuration for retry behavior.
+    
+    Frozen: handlers precompute delay tables from it at construction, so
+    it must never change afterwards; hashability also lets identical
+    configs share one handler. Slots skip the per-instance __dict__.
+    """
     max_attempts: int = 3
     base_delay: float = 1.0  # seconds
     max_delay: float = 60.0  # seconds
@@ -69,6 +107,44 @@ class RetryHandler:
         self._fibonacci_sequence = self._generate_fibonacci_sequence(
             self.config.max_attempts + 5  # Extra buffer
         )
+        
+        # Strategy resolved once to a bound method: per-attempt delay math
+        # is a direct call with no enum comparisons or branch chain.
+        self._delay_fn = {
+            RetryStrategy.EXPONENTIAL_BACKOFF: self._delay_exponential,
+            RetryStrategy.LINEAR_BACKOFF: self._delay_linear,
+            RetryStrategy.FIXED_DELAY: self._delay_fixed,
+            RetryStrategy.FIBONACCI_BACKOFF: self._delay_fibonacci,
+        }.get(self.config.strategy, self._delay_fixed)
+        
+        # Config is immutable after construction, so the whole capped delay
+        # ladder can be materialized once; the per-retry cost is then a
+        # tuple index plus optional jitter.
+        self._base_delays = tuple(
+            min(self._raw_delay(attempt), self.config.max_delay)
+            for attempt in range(self.config.max_attempts)
+        )
+        # Bound once to skip the module + attribute lookup per retry
+        self._rand = random.random
+        # jitter=True with a zero factor would still pay a PRNG draw and
+        # two multiplies per retry for a guaranteed-zero result.
+        self._apply_jitter = self.config.jitter and self.config.jitter_factor > 0
+        self._jitter_mult = self.config.jitter_factor
+        
+        # isinstance walks both exception tuples per failure; the verdict
+        # only depends on the exception type, so memoize it per type.
+        self._decision_cache: dict = {}
+        
+        # Level checks cached once so disabled log lines cost a bool test
+        # instead of formatting an f-string the logger then drops; call
+        # refresh_log_levels() after reconfiguring logging.
+        self._log_info = self.logger.isEnabledFor(logging.INFO)
+        self._log_warning = self.logger.isEnabledFor(logging.WARNING)
+    
+    def refresh_log_levels(self) -> None:
+        """Re-read cached log-level flags after logging reconfiguration."""
+        self._log_info = self.logger.isEnabledFor(logging.INFO)
+        self._log_warning = self.logger.isEnabledFor(logging.WARNING)
     
     def _generate_fibonacci_sequence(self, n: int) -> List[int]:
         """Generate fibonacci sequence up to n terms."""
@@ -83,6 +159,25 @@ class RetryHandler:
         
         return sequence
     
+    def _delay_exponential(self, attempt: int) -> float:
+        return self.config.base_delay * (self.config.exponential_factor ** attempt)
+    
+    def _delay_linear(self, attempt: int) -> float:
+        return self.config.base_delay * (attempt + 1)
+    
+    def _delay_fixed(self, attempt: int) -> float:
+        return self.config.base_delay
+    
+    def _delay_fibonacci(self, attempt: int) -> float:
+        if attempt < len(self._fibonacci_sequence):
+            return self.config.base_delay * self._fibonacci_sequence[attempt]
+        # Fall back to exponential for large attempts
+        return self._delay_exponential(attempt)
+    
+    def _raw_delay(self, attempt: int) -> float:
+        """Compute the uncapped strategy delay for an attempt number."""
+        return self._delay_fn(attempt)
+    
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay for given attempt number.
         
@@ -92,28 +187,14 @@ class RetryHandler:
         Returns:
             Delay in seconds
         """
-        if self.config.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
-            delay = self.config.base_delay * (self.config.exponential_factor ** attempt)
-        elif self.config.strategy == RetryStrategy.LINEAR_BACKOFF:
-            delay = self.config.base_delay * (attempt + 1)
-        elif self.config.strategy == RetryStrategy.FIXED_DELAY:
-            delay = self.config.base_delay
-        elif self.config.strategy == RetryStrategy.FIBONACCI_BACKOFF:
-            if attempt < len(self._fibonacci_sequence):
-                delay = self.config.base_delay * self._fibonacci_sequence[attempt]
-            else:
-                # Fall back to exponential for large attempts
-                delay = self.config.base_delay * (self.config.exponential_factor ** attempt)
+        if attempt < len(self._base_delays):
+            delay = self._base_delays[attempt]
         else:
-            delay = self.config.base_delay
-        
-        # Apply maximum delay limit
-        delay = min(delay, self.config.max_delay)
+            delay = min(self._raw_delay(attempt), self.config.max_delay)
         
         # Add jitter if enabled
-        if self.config.jitter:
-            jitter_amount = delay * self.config.jitter_factor * random.random()
-            delay += jitter_amount
+        if self._apply_jitter:
+            delay += delay * self._jitter_mult * self._rand()
         
         return delay
     
@@ -131,18 +212,30 @@ class RetryHandler:
         if attempt >= self.config.max_attempts:
             return False
         
-        # Check for non-retryable exceptions
+        exc_type = type(exception)
+        try:
+            return self._decision_cache[exc_type]
+        except KeyError:
+            pass
+        
+        # Non-retryable exceptions take precedence over retryable ones
         if self.config.non_retryable_exceptions and isinstance(
             exception, self.config.non_retryable_exceptions
         ):
-            return False
+            decision = False
+        else:
+            decision = isinstance(exception, self.config.retryable_exceptions)
         
-        # Check for retryable exceptions
-        return isinstance(exception, self.config.retryable_exceptions)
+        self._decision_cache[exc_type] = decision
+        return decision
     
     def execute_with_retry(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with retry logic.
         
+        The first invocation is a bare call with no loop bookkeeping or
+        logging; only an actual failure drops into the retry loop, so the
+        (overwhelmingly common) happy path pays nothing extra.
+        
         Args:
             func: Function to execute
             *args: Positional arguments for function
@@ -151,6 +244,73 @@ class RetryHandler:
         Returns:
             Function result
             
+        Raises:
+            RetryExhaustedError: When all retry attempts are exhausted
+            NonRetryableError: When a non-retryable exception occurs
+        """
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            return self._retry_slow_path(func, args, kwargs, e)
+    
+    def _retry_slow_path(self, func: Callable, args: tuple, kwargs: dict,
+                         first_exception: Exception) -> Any:
+        """Retry loop entered only after the initial attempt failed."""
+        last_exception = first_exception
+        attempt = 0
+        
+        while True:
+            if not self._should_retry(last_exception, attempt):
+                if isinstance(last_exception, self.config.non_retryable_exceptions):
+                    self.logger.error(f"Non-retryable exception occurred: {last_exception}")
+                    raise NonRetryableError(
+                        f"Non-retryable exception: {last_exception}"
+                    ) from last_exception
+                else:
+                    self.logger.error(f"Retry attempts exhausted. Last error: {last_exception}")
+                    raise RetryExhaustedError(attempt + 1, last_exception)
+            
+            if attempt >= self.config.max_attempts - 1:
+                self.logger.error(f"Final attempt failed: {last_exception}")
+                raise RetryExhaustedError(self.config.max_attempts, last_exception)
+            
+            delay = self._calculate_delay(attempt)
+            if self._log_warning:
+                self.logger.warning(
+                    f"Operation failed (attempt {attempt + 1}/{self.config.max_attempts}): "
+                    f"{last_exception}. Retrying in {delay:.2f} seconds..."
+                )
+            time.sleep(delay)
+            
+            attempt += 1
+            try:
+                result = func(*args, **kwargs)
+                if self._log_info:
+                    self.logger.info(f"Operation succeeded after {attempt + 1} attempts")
+                return result
+            except Exception as e:
+                last_exception = e
+
+
+class AsyncRetryHandler(RetryHandler):
+    """Async variant of RetryHandler for coroutine operations.
+    
+    Backoff awaits asyncio.sleep instead of blocking the thread, so many
+    concurrent retries share one event loop instead of serializing; delay
+    and retryability logic are inherited unchanged.
+    """
+    
+    async def execute_with_retry(self, func: Callable, *args, **kwargs) -> Any:
+        """Execute coroutine function with retry logic.
+        
+        Args:
+            func: Coroutine function to execute
+            *args: Positional arguments for function
+            **kwargs: Keyword arguments for function
+            
+        Returns:
+            Function result
+            
         Raises:
             RetryExhaustedError: When all retry attempts are exhausted
             NonRetryableError: When a non-retryable exception occurs
@@ -159,10 +319,9 @@ class RetryHandler:
         
         for attempt in range(self.config.max_attempts):
             try:
-                self.logger.debug(f"Attempting operation (attempt {attempt + 1}/{self.config.max_attempts})")
-                result = func(*args, **kwargs)
+                result = await func(*args, **kwargs)
                 
-                if attempt > 0:
+                if attempt > 0 and self._log_info:
                     self.logger.info(f"Operation succeeded after {attempt + 1} attempts")
                 
                 return result
@@ -178,21 +337,32 @@ class RetryHandler:
                         self.logger.error(f"Retry attempts exhausted. Last error: {e}")
                         raise RetryExhaustedError(attempt + 1, e)
                 
-                # Calculate delay for next attempt
                 if attempt < self.config.max_attempts - 1:  # Don't delay after last attempt
                     delay = self._calculate_delay(attempt)
-                    self.logger.warning(
-                        f"Operation failed (attempt {attempt + 1}/{self.config.max_attempts}): {e}. "
-                        f"Retrying in {delay:.2f} seconds..."
-                    )
-                    time.sleep(delay)
+                    if self._log_warning:
+                        self.logger.warning(
+                            f"Operation failed (attempt {attempt + 1}/{self.config.max_attempts}): {e}. "
+                            f"Retrying in {delay:.2f} seconds..."
+                        )
+                    await asyncio.sleep(delay)
                 else:
                     self.logger.error(f"Final attempt failed: {e}")
         
-        # This should never be reached, but just in case
         raise RetryExhaustedError(self.config.max_attempts, last_exception)
 
 
+@lru_cache(maxsize=128)
+def _get_handler(config: RetryConfig) -> RetryHandler:
+    """Return the shared handler for a config.
+    
+    Decorated functions frequently repeat the same few configs (e.g.
+    every retry_on_database_error(3, 0.5)); RetryConfig is frozen and
+    hashable, so identical configs share one handler and its precomputed
+    delay ladder, logger and decision cache.
+    """
+    return RetryHandler(config)
+
+
 def retry_with_backoff(
     max_attempts: int = 3,
     base_delay: float = 1.0,
@@ -221,27 +391,71 @@ def retry_with_backoff(
         Decorated function with retry logic
     """
     def decorator(func: Callable) -> Callable:
+        # Built once at decoration time: calls to the wrapped function pay
+        # a single execute_with_retry call, not a config + handler
+        # allocation (and fibonacci table rebuild) each.
+        config = RetryConfig(
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            exponential_factor=exponential_factor,
+            jitter=jitter,
+            jitter_factor=jitter_factor,
+            strategy=strategy,
+            retryable_exceptions=retryable_exceptions,
+            non_retryable_exceptions=non_retryable_exceptions
+        )
+        retry_handler = _get_handler(config)
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            config = RetryConfig(
-                max_attempts=max_attempts,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                exponential_factor=exponential_factor,
-                jitter=jitter,
-                jitter_factor=jitter_factor,
-                strategy=strategy,
-                retryable_exceptions=retryable_exceptions,
-                non_retryable_exceptions=non_retryable_exceptions
-            )
-            
-            retry_handler = RetryHandler(config)
             return retry_handler.execute_with_retry(func, *args, **kwargs)
         
         return wrapper
     return decorator
 
 
+def async_retry_with_backoff(
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    exponential_factor: float = 2.0,
+    jitter: bool = True,
+    jitter_factor: float = 0.1,
+    strategy: RetryStrategy = RetryStrategy.EXPONENTIAL_BACKOFF,
+    retryable_exceptions: tuple = (Exception,),
+    non_retryable_exceptions: tuple = ()
+):
+    """Decorator adding non-blocking retry logic to coroutine functions.
+    
+    Same parameters as retry_with_backoff; backoff delays await the event
+    loop instead of sleeping the thread.
+    
+    Returns:
+        Decorated coroutine function with retry logic
+    """
+    def decorator(func: Callable) -> Callable:
+        config = RetryConfig(
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            exponential_factor=exponential_factor,
+            jitter=jitter,
+            jitter_factor=jitter_factor,
+            strategy=strategy,
+            retryable_exceptions=retryable_exceptions,
+            non_retryable_exceptions=non_retryable_exceptions
+        )
+        retry_handler = AsyncRetryHandler(config)
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            return await retry_handler.execute_with_retry(func, *args, **kwargs)
+        
+        return wrapper
+    return decorator
+
+
 class CircuitBreaker:
     """Circuit breaker pattern implementation for failure protection."""
     
@@ -254,20 +468,40 @@ class CircuitBreaker:
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
-        self.failure_count = 0
-        self.last_failure_time = None
-        self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
+        # (state, failure_count, last_failure_ts) swapped as one tuple so
+        # concurrent readers never observe a half-updated transition;
+        # timestamps use the monotonic clock, immune to wall-clock jumps.
+        self._state_tuple = ('CLOSED', 0, None)  # CLOSED, OPEN, HALF_OPEN
+        self._lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
+        # Same cached level gate as RetryHandler
+        self._log_info = self.logger.isEnabledFor(logging.INFO)
+    
+    @property
+    def state(self) -> str:
+        return self._state_tuple[0]
+    
+    @property
+    def failure_count(self) -> int:
+        return self._state_tuple[1]
+    
+    @property
+    def last_failure_time(self) -> Optional[float]:
+        return self._state_tuple[2]
     
     def _is_recovery_timeout_reached(self) -> bool:
         """Check if recovery timeout has been reached."""
-        if self.last_failure_time is None:
+        last_failure = self._state_tuple[2]
+        if last_failure is None:
             return False
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+        return time.monotonic() - last_failure >= self.recovery_timeout
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with circuit breaker protection.
         
+        The lock is held only around state transitions, never around the
+        wrapped call itself.
+        
         Args:
             func: Function to execute
             *args: Positional arguments
@@ -279,55 +513,48 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is open or function fails
         """
-        if self.state == 'OPEN':
-            if self._is_recovery_timeout_reached():
-                self.state = 'HALF_OPEN'
-                self.logger.info("Circuit breaker moving to HALF_OPEN state")
-            else:
-                raise Exception("Circuit breaker is OPEN")
+        with self._lock:
+            state, failures, last_failure = self._state_tuple
+            if state == 'OPEN':
+                if self._is_recovery_timeout_reached():
+                    self._state_tuple = ('HALF_OPEN', failures, last_failure)
+                    if self._log_info:
+                        self.logger.info("Circuit breaker moving to HALF_OPEN state")
+                else:
+                    raise Exception("Circuit breaker is OPEN")
         
         try:
             result = func(*args, **kwargs)
-            
-            # Success - reset failure count and close circuit
-            if self.state == 'HALF_OPEN':
-                self.state = 'CLOSED'
+        except Exception:
+            with self._lock:
+                state, failures, _ = self._state_tuple
+                failures += 1
+                if failures >= self.failure_threshold:
+                    self._state_tuple = ('OPEN', failures, time.monotonic())
+                    self.logger.error(f"Circuit breaker opened after {failures} failures")
+                else:
+                    self._state_tuple = (state, failures, time.monotonic())
+            raise
+        
+        # Success - reset failure count and close circuit
+        with self._lock:
+            state, _, last_failure = self._state_tuple
+            if state == 'HALF_OPEN' and self._log_info:
                 self.logger.info("Circuit breaker closed - service recovered")
-            
-            self.failure_count = 0
-            return result
-            
-        except Exception as e:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
-            
-            if self.failure_count >= self.failure_threshold:
-                self.state = 'OPEN'
-                self.logger.error(f"Circuit breaker opened after {self.failure_count} failures")
-            
-            raise e
+            self._state_tuple = ('CLOSED', 0, last_failure)
+        
+        return result
 
 
 # Convenience functions for common retry scenarios
 def retry_on_network_error(max_attempts: int = 3, base_delay: float = 2.0):
     """Retry decorator for network-related operations."""
-    import requests
-    from urllib.error import URLError
-    
     return retry_with_backoff(
         max_attempts=max_attempts,
         base_delay=base_delay,
         max_delay=30.0,
-        retryable_exceptions=(
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-            requests.exceptions.HTTPError,
-            URLError,
-            OSError,  # Network-related OS errors
-        ),
-        non_retryable_exceptions=(
-            requests.exceptions.HTTPError,  # Client errors (4xx) shouldn't be retried
-        )
+        retryable_exceptions=_NETWORK_RETRYABLE,
+        non_retryable_exceptions=_REQUESTS_NON_RETRYABLE
     )
 
 
@@ -348,17 +575,10 @@ def retry_on_api_error(max_attempts: int = 5, base_delay: float = 1.0):
 
 def retry_on_database_error(max_attempts: int = 3, base_delay: float = 0.5):
     """Retry decorator for database operations."""
-    import sqlite3
-    
     return retry_with_backoff(
         max_attempts=max_attempts,
         base_delay=base_delay,
         max_delay=10.0,
-        retryable_exceptions=(
-            sqlite3.OperationalError,
-            sqlite3.DatabaseError,
-        ),
-        non_retryable_exceptions=(
-            sqlite3.IntegrityError,  # Don't retry on constraint violations
-        )
+        retryable_exceptions=_DB_RETRYABLE,
+        non_retryable_exceptions=_DB_NON_RETRYABLE
     )
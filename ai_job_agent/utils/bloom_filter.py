@@ -0,0 +1,52 @@
+"""Compact Bloom filter for fast-path membership rejection."""
+
+import math
+from typing import Hashable
+
+
+class BloomFilter:
+    """Probabilistic set with no false negatives.
+
+    Sized from an expected capacity and target false-positive rate; a
+    miss here means the key is definitely new, so callers can skip the
+    exact (and more expensive) membership structure for the common case.
+    """
+
+    # Salt for the second hash in the double-hashing scheme.
+    _SALT = 0x9E3779B97F4A7C15
+
+    def __init__(self, capacity: int = 8192, error_rate: float = 0.001):
+        """Initialize the filter.
+
+        Args:
+            capacity (int): Expected number of distinct keys
+            error_rate (float): Target false-positive probability at capacity
+        """
+        ln2 = math.log(2)
+        self._num_bits = max(
+            8, int(-capacity * math.log(error_rate) / (ln2 * ln2))
+        )
+        self._num_hashes = max(1, round((self._num_bits / capacity) * ln2))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+
+    def _indexes(self, key: Hashable):
+        # Double hashing: two base hashes generate all k probe positions
+        # without re-hashing the key k times.
+        h1 = hash(key)
+        h2 = hash((key, self._SALT)) | 1
+        num_bits = self._num_bits
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, key: Hashable) -> None:
+        """Record key in the filter."""
+        bits = self._bits
+        for index in self._indexes(key):
+            bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, key: Hashable) -> bool:
+        bits = self._bits
+        for index in self._indexes(key):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
@@ -1,9 +1,11 @@
 """Error handling utilities for the AI job agent."""
 
 import logging
-import traceback
+import random
+import time
+import orjson
 from typing import Optional, Any, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 from enum import Enum
 
 
@@ -15,6 +17,12 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Dense ordinal per severity: counter updates index a flat list instead
+# of hashing an enum member into a dict on every handled error.
+for _ord, _severity in enumerate(ErrorSeverity):
+    _severity._ord = _ord
+
+
 class JobAgentError(Exception):
     """Base exception class for job agent errors."""
     
@@ -50,40 +58,73 @@ class ConfigurationError(JobAgentError):
     pass
 
 
+# Default severity per exception class; the decorator and handle_error use
+# this so call sites stop plumbing ErrorSeverity through manually.
+_SEVERITY_BY_EXC = {
+    ConfigurationError: ErrorSeverity.CRITICAL,
+    APIError: ErrorSeverity.HIGH,
+    WebScrapingError: ErrorSeverity.MEDIUM,
+    ValidationError: ErrorSeverity.LOW,
+}
+
+
+@lru_cache(maxsize=None)
+def _severity_for(exc_type: type) -> ErrorSeverity:
+    """Resolve the default severity for an exception type.
+
+    Walks the MRO once so subclasses inherit their parent's severity;
+    lru_cache makes every later lookup for the same type a dict hit.
+    """
+    for klass in exc_type.__mro__:
+        hit = _SEVERITY_BY_EXC.get(klass)
+        if hit is not None:
+            return hit
+    return ErrorSeverity.MEDIUM
+
+
 class ErrorHandler:
     """Central error handling and logging system."""
     
     def __init__(self, logger_name: str = __name__):
         """Initialize error handler."""
         self.logger = logging.getLogger(logger_name)
-        self.error_counts = {
-            ErrorSeverity.LOW: 0,
-            ErrorSeverity.MEDIUM: 0,
-            ErrorSeverity.HIGH: 0,
-            ErrorSeverity.CRITICAL: 0
+        # Flat per-ordinal counters; see ErrorSeverity._ord
+        self.error_counts = [0] * len(ErrorSeverity)
+        # severity -> (log method, include traceback, numeric level),
+        # resolved once; one dict probe per error instead of walking an
+        # if/elif chain.
+        self._loggers = {
+            ErrorSeverity.CRITICAL: (self.logger.critical, True, logging.CRITICAL),
+            ErrorSeverity.HIGH: (self.logger.error, True, logging.ERROR),
+            ErrorSeverity.MEDIUM: (self.logger.warning, False, logging.WARNING),
+            ErrorSeverity.LOW: (self.logger.info, False, logging.INFO),
         }
     
-    def handle_error(self, error: Exception, severity: ErrorSeverity = ErrorSeverity.MEDIUM,
+    def handle_error(self, error: Exception, severity: Optional[ErrorSeverity] = None,
                     context: Optional[dict] = None, reraise: bool = False) -> bool:
-        """Handle and log an error."""
+        """Handle and log an error.
+
+        When severity is None it is inferred from the error's type via
+        _SEVERITY_BY_EXC (falling back to MEDIUM).
+        """
         try:
+            if severity is None:
+                severity = _severity_for(type(error))
             # Update error counts
-            self.error_counts[severity] += 1
-            
-            # Create error message
-            error_msg = f"Error: {str(error)}"
-            if context:
-                error_msg += f" | Context: {context}"
+            self.error_counts[severity._ord] += 1
             
-            # Log based on severity
-            if severity == ErrorSeverity.CRITICAL:
-                self.logger.critical(error_msg, exc_info=True)
-            elif severity == ErrorSeverity.HIGH:
-                self.logger.error(error_msg, exc_info=True)
-            elif severity == ErrorSeverity.MEDIUM:
-                self.logger.warning(error_msg)
-            else:
-                self.logger.info(error_msg)
+            # %-style lazy args: filtered severities skip both str(error)
+            # and context stringification entirely.
+            log_fn, exc_info, level = self._loggers[severity]
+            if self.logger.isEnabledFor(level):
+                if context:
+                    # orjson beats dict.__repr__ on nested contexts;
+                    # default=repr keeps arbitrary values loggable.
+                    log_fn("Error: %s | Context: %s", error,
+                           orjson.dumps(context, default=repr).decode(),
+                           exc_info=exc_info)
+                else:
+                    log_fn("Error: %s", error, exc_info=exc_info)
             
             # Reraise if requested
             if reraise:
@@ -97,22 +138,39 @@ class ErrorHandler:
     
     def get_error_summary(self) -> dict:
         """Get summary of error counts."""
-        return self.error_counts.copy()
+        return {
+            severity: self.error_counts[severity._ord]
+            for severity in ErrorSeverity
+        }
     
     def reset_counts(self):
         """Reset error counts."""
-        for severity in self.error_counts:
-            self.error_counts[severity] = 0
+        self.error_counts = [0] * len(ErrorSeverity)
+
 
+# Shared default handler: per-call ErrorHandler() construction would pay
+# a logger lookup and counts-dict allocation on every wrapped invocation.
+# Counter increments are GIL-atomic, so sharing across threads is safe.
+_DEFAULT_HANDLER = None
 
-def error_handler_decorator(severity: ErrorSeverity = ErrorSeverity.MEDIUM, 
+
+def _default_handler() -> ErrorHandler:
+    """Return the lazily-created module-wide ErrorHandler."""
+    global _DEFAULT_HANDLER
+    if _DEFAULT_HANDLER is None:
+        _DEFAULT_HANDLER = ErrorHandler()
+    return _DEFAULT_HANDLER
+
+
+def error_handler_decorator(severity: Optional[ErrorSeverity] = None, 
                           reraise: bool = False, 
                           default_return: Any = None):
     """Decorator for automatic error handling."""
     def decorator(func: Callable):
+        handler = _default_handler()
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            handler = ErrorHandler()
             try:
                 return func(*args, **kwargs)
             except Exception as e:
@@ -122,25 +180,41 @@ def error_handler_decorator(severity: ErrorSeverity = ErrorSeverity.MEDIUM,
     return decorator
 
 
-def safe_execute(func: Callable, *args, max_retries: int = 3, 
-                delay: float = 1.0, **kwargs):
-    """Safely execute a function with retries."""
-    import time
-    
-    handler = ErrorHandler()
+def safe_execute(func: Callable, *args, max_retries: int = 3,
+                delay: float = 1.0, max_delay: float = 30.0,
+                max_total_wait: float = 120.0,
+                retry_on: tuple = (Exception,),
+                handler: Optional[ErrorHandler] = None,
+                **kwargs):
+    """Safely execute a function with exponentially backed-off retries.
+
+    Sleeps grow as delay * 2**attempt (capped at max_delay) with jitter,
+    so short transients retry quickly while persistent failures back off.
+    A monotonic deadline bounds total wall-clock spent retrying, and
+    exceptions outside retry_on fail immediately instead of burning
+    max_retries attempts on errors that cannot succeed.
+    """
+    handler = handler or _default_handler()
     last_error = None
-    
+    deadline = time.monotonic() + max_total_wait
+
     for attempt in range(max_retries + 1):
         try:
             result = func(*args, **kwargs)
             return True, result
         except Exception as e:
             last_error = e
-            severity = ErrorSeverity.HIGH if attempt == max_retries else ErrorSeverity.MEDIUM
-            handler.handle_error(e, severity, 
+            retryable = isinstance(e, retry_on)
+            final = not retryable or attempt == max_retries
+            severity = ErrorSeverity.HIGH if final else ErrorSeverity.MEDIUM
+            handler.handle_error(e, severity,
                                context={"attempt": attempt + 1, "max_retries": max_retries})
-            
-            if attempt < max_retries:
-                time.sleep(delay)
-    
+
+            if final:
+                break
+            sleep = min(max_delay, delay * 2 ** attempt) * (0.5 + random.random() * 0.5)
+            if time.monotonic() + sleep >= deadline:
+                break
+            time.sleep(sleep)
+
     return False, last_error
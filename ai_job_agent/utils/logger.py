@@ -1,17 +1,40 @@
 """Logging utilities for the AI job agent."""
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime
+import orjson
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 
-class ColoredFormatter(logging.Formatter):
+class FastFormatter(logging.Formatter):
+    """Formatter that caches the formatted timestamp per second.
+
+    A busy scraper emits many records within the same second; strftime
+    is only re-run when the integer second (or date format) changes.
+    """
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self._asctime_key = None
+        self._asctime_value = ''
+
+    def formatTime(self, record, datefmt=None):
+        """Format record time, reusing the cached string within a second."""
+        key = (int(record.created), datefmt)
+        if key != self._asctime_key:
+            self._asctime_value = super().formatTime(record, datefmt)
+            self._asctime_key = key
+        return self._asctime_value
+
+
+class ColoredFormatter(FastFormatter):
     """Custom colored formatter for console output."""
-    
+
     # Color codes for different log levels
     COLORS = {
         'DEBUG': '\033[36m',     # Cyan
@@ -21,12 +44,33 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[35m',  # Magenta
     }
     RESET = '\033[0m'
-    
+
+    def __init__(self, fmt=None, datefmt=None):
+        """Initialize the formatter, precomputing colored level names.
+
+        The colored level strings are constants, so build them once here
+        instead of allocating f-strings per record; coloring is skipped
+        entirely when stdout is not a terminal.
+        """
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        if sys.stdout.isatty():
+            self._colored_levels = {
+                level: f"{color}{level}{self.RESET}"
+                for level, color in self.COLORS.items()
+            }
+        else:
+            self._colored_levels = {}
+
     def format(self, record):
-        """Format log record with colors."""
-        log_color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        record.msg = f"{log_color}{record.msg}{self.RESET}"
+        """Format log record with colors.
+
+        Only the level name is swapped for its precomputed colored form;
+        record.msg is left untouched so %-style lazy formatting still
+        applies.
+        """
+        record.levelname = self._colored_levels.get(
+            record.levelname, record.levelname
+        )
         return super().format(record)
 
 
@@ -43,7 +87,19 @@ class JobAgentLogger:
         self.name = name
         self.log_dir = Path(log_dir)
         self.logger = None
+        # Configured loggers keyed by (name, level, console, file); repeat
+        # get_logger calls must not re-open log files or rebuild handlers.
+        self._cache: Dict[tuple, logging.Logger] = {}
+        # Background queue listeners draining log I/O off the hot path
+        self._listeners: list = []
+        atexit.register(self._stop_listeners)
         self._setup_log_directory()
+
+    def _stop_listeners(self):
+        """Flush and stop all background log listeners."""
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners.clear()
     
     def _setup_log_directory(self):
         """Create log directory if it doesn't exist."""
@@ -53,7 +109,7 @@ class JobAgentLogger:
                   level: int = logging.INFO, 
                   console_output: bool = True,
                   file_output: bool = True,
-                  max_file_size: int = 10 * 1024 * 1024,  # 10MB
+                  when: str = 'midnight',
                   backup_count: int = 5) -> logging.Logger:
         """Get configured logger instance.
         
@@ -62,19 +118,31 @@ class JobAgentLogger:
             level (int): Logging level
             console_output (bool): Enable console output
             file_output (bool): Enable file output
-            max_file_size (int): Maximum file size before rotation
+            when (str): Time-based rotation interval
             backup_count (int): Number of backup files to keep
             
         Returns:
             logging.Logger: Configured logger
         """
         logger_name = f"{self.name}.{component}" if component else self.name
+        cache_key = (logger_name, level, console_output, file_output)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.logger = cached
+            return cached
+
         logger = logging.getLogger(logger_name)
-        
-        # Clear existing handlers to avoid duplicates
-        logger.handlers.clear()
+
+        # getLogger returns a process-wide singleton; if it is already
+        # configured, reuse it instead of tearing down live handlers.
+        if logger.handlers:
+            self._cache[cache_key] = logger
+            self.logger = logger
+            return logger
         logger.setLevel(level)
         
+        sink_handlers = []
+
         # Console handler
         if console_output:
             console_handler = logging.StreamHandler(sys.stdout)
@@ -83,27 +151,42 @@ class JobAgentLogger:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             console_handler.setFormatter(console_formatter)
-            logger.addHandler(console_handler)
+            sink_handlers.append(console_handler)
         
-        # File handler with rotation
+        # File handler with time-based rotation: rotation becomes a cheap
+        # time compare instead of a stat() per emit, and delay=True defers
+        # opening the file until something is actually written.
         if file_output:
             log_filename = self.log_dir / f"{logger_name.replace('.', '_')}.log"
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = logging.handlers.TimedRotatingFileHandler(
                 log_filename,
-                maxBytes=max_file_size,
+                when=when,
                 backupCount=backup_count,
-                encoding='utf-8'
+                encoding='utf-8',
+                delay=True
             )
-            file_formatter = logging.Formatter(
+            file_formatter = FastFormatter(
                 fmt='%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            sink_handlers.append(file_handler)
+
+        # Producers only enqueue records (O(1)); a background listener
+        # thread drains them to console/disk so emitters never block on I/O.
+        if sink_handlers:
+            log_queue = queue.Queue(-1)
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            listener = logging.handlers.QueueListener(
+                log_queue, *sink_handlers, respect_handler_level=True
+            )
+            listener.start()
+            self._listeners.append(listener)
         
         # Prevent propagation to root logger
         logger.propagate = False
-        
+
+        self._cache[cache_key] = logger
         self.logger = logger
         return logger
     
@@ -116,11 +199,14 @@ class JobAgentLogger:
             duration (float): Operation duration in seconds
             metadata (dict, optional): Additional metadata
         """
-        if self.logger:
-            msg = f"Performance: {operation} completed in {duration:.3f}s"
+        if self.logger and self.logger.isEnabledFor(logging.INFO):
             if metadata:
-                msg += f" | Metadata: {metadata}"
-            self.logger.info(msg)
+                # orjson beats str() on dict stringification by a wide margin
+                self.logger.info("Performance: %s completed in %.3fs | Metadata: %s",
+                                 operation, duration, orjson.dumps(metadata).decode())
+            else:
+                self.logger.info("Performance: %s completed in %.3fs",
+                                 operation, duration)
     
     def log_error_context(self, error: Exception, context: Dict[str, Any]):
         """Log error with detailed context.
@@ -129,9 +215,10 @@ class JobAgentLogger:
             error (Exception): The exception that occurred
             context (dict): Contextual information
         """
-        if self.logger:
+        if self.logger and self.logger.isEnabledFor(logging.ERROR):
             self.logger.error(
-                f"Error: {type(error).__name__}: {str(error)} | Context: {context}",
+                "Error: %s: %s | Context: %s",
+                type(error).__name__, error, orjson.dumps(context).decode(),
                 exc_info=True
             )
     
@@ -144,7 +231,8 @@ class JobAgentLogger:
             new_state (str): New state
         """
         if self.logger:
-            self.logger.info(f"State change in {component}: {old_state} -> {new_state}")
+            self.logger.info("State change in %s: %s -> %s",
+                             component, old_state, new_state)
     
     def create_session_logger(self, session_id: str) -> logging.Logger:
         """Create a logger for a specific session.
@@ -159,13 +247,14 @@ class JobAgentLogger:
         session_log_dir.mkdir(exist_ok=True)
         
         session_logger = logging.getLogger(f"{self.name}.session.{session_id}")
-        session_logger.handlers.clear()
+        if session_logger.handlers:
+            return session_logger
         session_logger.setLevel(logging.INFO)
         
         # Session file handler
         session_log_file = session_log_dir / f"session_{session_id}.log"
         session_handler = logging.FileHandler(session_log_file, encoding='utf-8')
-        session_formatter = logging.Formatter(
+        session_formatter = FastFormatter(
             fmt='%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
@@ -230,7 +319,7 @@ def log_function_call(func_name: str, args: tuple = (), kwargs: dict = None):
     """
     logger = get_logger("function_calls")
     kwargs = kwargs or {}
-    logger.debug(f"Calling {func_name} with args={args}, kwargs={kwargs}")
+    logger.debug("Calling %s with args=%s, kwargs=%s", func_name, args, kwargs)
 
 
 def log_data_flow(data_type: str, data_size: int, source: str, destination: str):
@@ -243,4 +332,5 @@ def log_data_flow(data_type: str, data_size: int, source: str, destination: str)
         destination (str): Destination component
     """
     logger = get_logger("data_flow")
-    logger.info(f"Data flow: {data_type} ({data_size} bytes) from {source} to {destination}")
+    logger.info("Data flow: %s (%s bytes) from %s to %s",
+                data_type, data_size, source, destination)
@@ -2,11 +2,104 @@
 
 import re
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union, Callable
 from datetime import datetime, date
 from pathlib import Path
-from urllib.parse import urlparse
-import json
+from urllib.parse import urlsplit
+import orjson
+
+# Compiled once at import: validators run per-field in loops, and going
+# through re.match with a string pattern pays a cache lookup (and a full
+# re-parse whenever re's internal cache churns) on every call.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Deletion table for phone separators: str.translate strips them in one
+# C-level pass, where the old character-class re.sub ran the regex
+# engine for what is a plain character strip.
+_PHONE_STRIP_TABLE = str.maketrans('', '', ' \t\n\r\x0b\x0c-()+')
+
+# 256-entry membership tables for the three email character classes.
+# A hand-rolled scan over these is a deterministic O(n) pass, where the
+# regex engine's unbounded '+' quantifiers over overlapping classes can
+# backtrack quadratically on adversarial inputs.
+_ALNUM = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+_EMAIL_LOCAL_TBL = bytearray(256)
+_EMAIL_DOMAIN_TBL = bytearray(256)
+_EMAIL_TLD_TBL = bytearray(256)
+for _c in _ALNUM + b'._%+-':
+    _EMAIL_LOCAL_TBL[_c] = 1
+for _c in _ALNUM + b'.-':
+    _EMAIL_DOMAIN_TBL[_c] = 1
+for _c in _ALNUM[:52]:
+    _EMAIL_TLD_TBL[_c] = 1
+
+
+def _email_scan(b: bytes) -> bool:
+    """Single-pass equivalent of _EMAIL_RE over ASCII bytes."""
+    n = len(b)
+    i = 0
+    while i < n and _EMAIL_LOCAL_TBL[b[i]]:
+        i += 1
+    # Non-empty local part followed by exactly one '@'
+    if i == 0 or i >= n or b[i] != 0x40:
+        return False
+    i += 1
+    domain_start = i
+    while i < n and _EMAIL_DOMAIN_TBL[b[i]]:
+        i += 1
+    if i != n:
+        return False
+    # Last dot must leave a non-empty domain and an alpha TLD of >= 2
+    dot = b.rfind(b'.', domain_start)
+    if dot <= domain_start or n - dot - 1 < 2:
+        return False
+    for j in range(dot + 1, n):
+        if not _EMAIL_TLD_TBL[b[j]]:
+            return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str):
+    """Compile and memoize a caller-supplied regex pattern."""
+    return re.compile(pattern)
+
+
+# Shared failure messages: one interned str object instead of a fresh
+# literal allocation at each failure site.
+_MSG_INVALID_EMAIL = "Invalid email format"
+_MSG_INVALID_URL = "Invalid URL format"
+_MSG_PHONE_DIGITS = "Phone must contain only digits"
+
+
+@lru_cache(maxsize=1024)
+def _range_msg(op: str, bound) -> str:
+    """Memoize range-failure messages; bounds repeat across records."""
+    return f"Value must be {op} {bound}"
+
+
+@lru_cache(maxsize=1024)
+def _length_msg(op: str, bound) -> str:
+    """Memoize length-failure messages; bounds repeat across records."""
+    return f"Length must be {op} {bound} characters"
+
+
+@lru_cache(maxsize=256)
+def _as_set(choices: tuple) -> frozenset:
+    """Freeze a choices tuple into a set for O(1) membership tests."""
+    return frozenset(choices)
+
+
+@lru_cache(maxsize=64)
+def _norm_exts(exts: tuple) -> frozenset:
+    """Lowercase an allowed-extensions tuple into a frozenset once.
+
+    Callers pass the same few extension lists on every file check;
+    memoizing turns the per-call list rebuild and linear scan into a
+    hashed membership test.
+    """
+    return frozenset(ext.lower() for ext in exts)
 
 
 class ValidationError(Exception):
@@ -24,16 +117,30 @@ class ValidationError(Exception):
         self.field = field
         self.value = value
         self.message = message
-    
+        self._rendered = None
+
     def __str__(self):
-        if self.field:
-            return f"Validation error for field '{self.field}': {self.message}"
-        return f"Validation error: {self.message}"
+        # Rendered lazily and cached: the message is only paid for when
+        # something actually formats the exception.
+        rendered = self._rendered
+        if rendered is None:
+            if self.field:
+                rendered = f"Validation error for field '{self.field}': {self.message}"
+            else:
+                rendered = f"Validation error: {self.message}"
+            self._rendered = rendered
+        return rendered
 
 
 class DataValidator:
     """Comprehensive data validation utility."""
-    
+
+    # Class-level sentinel: nothing in the class reads this, so each
+    # instance skips allocating an empty dict (the convenience API
+    # builds validators in loops). Assigning to it on an instance
+    # shadows the sentinel with a fresh per-instance dict as usual.
+    validation_rules: Dict[str, Any] = {}
+
     def __init__(self, strict_mode: bool = False):
         """Initialize validator.
         
@@ -42,17 +149,29 @@ class DataValidator:
         """
         self.strict_mode = strict_mode
         self.logger = logging.getLogger(__name__)
-        self.validation_rules = {}
+        # Compiled per-schema validators keyed by id(schema); the schema
+        # itself is kept alongside so the id cannot be recycled.
+        self._compiled_schemas: Dict[int, tuple] = {}
+        # Set False to silence failure logging entirely on hot paths
+        self._log_errors = True
     
     def _log_validation_error(self, field: str, value: Any, message: str):
-        """Log validation error."""
-        self.logger.warning(f"Validation failed for {field}='{value}': {message}")
+        """Log validation error.
+
+        Gated on isEnabledFor with %-style lazy args, so a failed
+        validation with warnings filtered (the common production
+        setting) allocates no message string.
+        """
+        if self._log_errors and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("Validation failed for %s=%r: %s",
+                                field, value, message)
     
     def _handle_validation_error(self, field: str, value: Any, message: str) -> bool:
         """Handle validation error based on strict mode."""
         self._log_validation_error(field, value, message)
         if self.strict_mode:
-            raise ValidationError(message, field, value)
+            # from None: no __context__ chain to format when it propagates
+            raise ValidationError(message, field, value) from None
         return False
     
     def validate_email(self, email: str, field: str = "email") -> bool:
@@ -67,11 +186,20 @@ class DataValidator:
         """
         if not isinstance(email, str):
             return self._handle_validation_error(field, email, "Email must be a string")
-        
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
-            return self._handle_validation_error(field, email, "Invalid email format")
-        
+
+        # Substring pre-check rejects almost all invalid inputs without
+        # paying regex-engine startup.
+        if '@' not in email or '.' not in email:
+            return self._handle_validation_error(field, email, _MSG_INVALID_EMAIL)
+
+        try:
+            valid = _email_scan(email.encode('ascii'))
+        except UnicodeEncodeError:
+            # Non-ASCII input: fall back to the compiled pattern
+            valid = _EMAIL_RE.match(email) is not None
+        if not valid:
+            return self._handle_validation_error(field, email, _MSG_INVALID_EMAIL)
+
         return True
     
     def validate_url(self, url: str, field: str = "url", 
@@ -88,13 +216,28 @@ class DataValidator:
         """
         if not isinstance(url, str):
             return self._handle_validation_error(field, url, "URL must be a string")
-        
+
+        # One substring scan rejects obvious non-URLs without allocating
+        # a ParseResult.
+        if '://' not in url:
+            return self._handle_validation_error(field, url, _MSG_INVALID_URL)
+
+        # Fast-accept only: an exact prefix match settles the scheme
+        # check without waiting for the parse, but a miss is not a
+        # verdict — urlsplit normalizes case and leading whitespace, so
+        # mismatches fall through to the comparison on parsed.scheme.
+        scheme_ok = bool(allowed_schemes) and url.startswith(
+            tuple(scheme + '://' for scheme in allowed_schemes)
+        )
+
         try:
-            parsed = urlparse(url)
+            # urlsplit skips the ;params scan urlparse does; only scheme
+            # and netloc are inspected here
+            parsed = urlsplit(url)
             if not parsed.scheme or not parsed.netloc:
-                return self._handle_validation_error(field, url, "Invalid URL format")
-            
-            if allowed_schemes and parsed.scheme not in allowed_schemes:
+                return self._handle_validation_error(field, url, _MSG_INVALID_URL)
+
+            if allowed_schemes and not scheme_ok and parsed.scheme not in allowed_schemes:
                 return self._handle_validation_error(
                     field, url, f"URL scheme must be one of: {allowed_schemes}"
                 )
@@ -119,15 +262,24 @@ class DataValidator:
             return self._handle_validation_error(field, phone, "Phone must be a string")
         
         # Remove common separators
-        cleaned_phone = re.sub(r'[\s\-\(\)\+]', '', phone)
-        
-        # Basic validation - digits only, reasonable length
-        if not cleaned_phone.isdigit():
-            return self._handle_validation_error(field, phone, "Phone must contain only digits")
-        
-        if len(cleaned_phone) < 7 or len(cleaned_phone) > 15:
+        cleaned_phone = phone.translate(_PHONE_STRIP_TABLE)
+
+        # Basic validation - digits only, reasonable length. strip()
+        # leaves bytes iff any non-digit is present, replacing the full
+        # isdigit() traversal with one C-level pass over the bytes.
+        try:
+            cleaned_bytes = cleaned_phone.encode('ascii')
+        except UnicodeEncodeError:
+            # Non-ASCII digits: take the generic unicode-aware path
+            if not cleaned_phone.isdigit():
+                return self._handle_validation_error(field, phone, _MSG_PHONE_DIGITS)
+            cleaned_bytes = b'0' * len(cleaned_phone)
+        if not cleaned_bytes or cleaned_bytes.strip(b'0123456789'):
+            return self._handle_validation_error(field, phone, _MSG_PHONE_DIGITS)
+
+        if len(cleaned_bytes) < 7 or len(cleaned_bytes) > 15:
             return self._handle_validation_error(field, phone, "Phone number length invalid")
-        
+
         return True
     
     def validate_date(self, date_value: Union[str, date, datetime], 
@@ -178,12 +330,12 @@ class DataValidator:
         
         if min_val is not None and value < min_val:
             return self._handle_validation_error(
-                field, value, f"Value must be >= {min_val}"
+                field, value, _range_msg('>=', min_val)
             )
         
         if max_val is not None and value > max_val:
             return self._handle_validation_error(
-                field, value, f"Value must be <= {max_val}"
+                field, value, _range_msg('<=', max_val)
             )
         
         return True
@@ -209,12 +361,12 @@ class DataValidator:
         
         if min_length is not None and length < min_length:
             return self._handle_validation_error(
-                field, value, f"Length must be >= {min_length} characters"
+                field, value, _length_msg('>=', min_length)
             )
         
         if max_length is not None and length > max_length:
             return self._handle_validation_error(
-                field, value, f"Length must be <= {max_length} characters"
+                field, value, _length_msg('<=', max_length)
             )
         
         return True
@@ -230,11 +382,18 @@ class DataValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        if value not in choices:
+        # Schema-driven validation checks the same choices list against
+        # every record; a cached frozenset makes membership O(1).
+        # Unhashable values or choices fall back to the linear scan.
+        try:
+            valid = value in _as_set(tuple(choices))
+        except TypeError:
+            valid = value in choices
+        if not valid:
             return self._handle_validation_error(
                 field, value, f"Value must be one of: {choices}"
             )
-        
+
         return True
     
     def validate_regex(self, value: str, field: str, pattern: str, 
@@ -244,7 +403,8 @@ class DataValidator:
         Args:
             value (str): String to validate
             field (str): Field name for error reporting
-            pattern (str): Regex pattern
+            pattern (str or re.Pattern): Regex pattern, optionally
+                precompiled (see prepare_schema)
             description (str): Description of pattern for error messages
             
         Returns:
@@ -252,9 +412,13 @@ class DataValidator:
         """
         if not isinstance(value, str):
             return self._handle_validation_error(field, value, "Value must be a string")
-        
+
         try:
-            if not re.match(pattern, value):
+            if isinstance(pattern, re.Pattern):
+                compiled = pattern
+            else:
+                compiled = _compile_pattern(pattern)
+            if not compiled.match(value):
                 return self._handle_validation_error(
                     field, value, f"Value must match {description}"
                 )
@@ -279,19 +443,32 @@ class DataValidator:
             bool: True if valid, False otherwise
         """
         try:
-            path_obj = Path(path)
-            
-            if must_exist and not path_obj.exists():
-                return self._handle_validation_error(
-                    field, path, "File does not exist"
-                )
-            
+            if must_exist:
+                # exists() forces a syscall anyway, so the Path object
+                # costs nothing extra here
+                path_obj = Path(path)
+                if not path_obj.exists():
+                    return self._handle_validation_error(
+                        field, path, "File does not exist"
+                    )
+                suffix = path_obj.suffix.lower()
+            else:
+                # Pure string inspection: no OS-flavor dispatch or Path
+                # allocation when nothing touches the filesystem. The
+                # dot-position rule mirrors pathlib's suffix semantics.
+                base = str(path).rsplit('/', 1)[-1]
+                dot = base.rfind('.')
+                if 0 < dot < len(base) - 1:
+                    suffix = base[dot:].lower()
+                else:
+                    suffix = ''
+
             if allowed_extensions:
-                if path_obj.suffix.lower() not in [ext.lower() for ext in allowed_extensions]:
+                if suffix not in _norm_exts(tuple(allowed_extensions)):
                     return self._handle_validation_error(
                         field, path, f"File extension must be one of: {allowed_extensions}"
                     )
-            
+
             return True
         except Exception as e:
             return self._handle_validation_error(
@@ -312,13 +489,208 @@ class DataValidator:
             return self._handle_validation_error(field, value, "JSON must be a string")
         
         try:
-            json.loads(value)
+            # Parse-and-discard in C: orjson checks syntax several times
+            # faster than json.loads and the object tree is dropped anyway
+            orjson.loads(value)
             return True
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             return self._handle_validation_error(
                 field, value, f"Invalid JSON: {e}"
             )
     
+    def validate_emails_batch(self, emails: List[Any]) -> List[bool]:
+        """Validate many email addresses in one pass.
+
+        Skips the per-call error handling and logging of validate_email;
+        the scan runs against pre-bound locals so the loop body is just
+        the charset walk. Invalid entries simply come back False.
+
+        Args:
+            emails (list): Candidate email values
+
+        Returns:
+            list[bool]: Per-input validity, same order as the input
+        """
+        scan = _email_scan
+        results = []
+        append = results.append
+        for email in emails:
+            if not isinstance(email, str) or '@' not in email or '.' not in email:
+                append(False)
+                continue
+            try:
+                append(scan(email.encode('ascii')))
+            except UnicodeEncodeError:
+                append(_EMAIL_RE.match(email) is not None)
+        return results
+
+    def validate_phones_batch(self, phones: List[Any]) -> List[bool]:
+        """Validate many phone numbers in one pass.
+
+        Args:
+            phones (list): Candidate phone values
+
+        Returns:
+            list[bool]: Per-input validity, same order as the input
+        """
+        table = _PHONE_STRIP_TABLE
+        results = []
+        append = results.append
+        for phone in phones:
+            if not isinstance(phone, str):
+                append(False)
+                continue
+            cleaned = phone.translate(table)
+            try:
+                b = cleaned.encode('ascii')
+            except UnicodeEncodeError:
+                append(cleaned.isdigit() and 7 <= len(cleaned) <= 15)
+                continue
+            append(bool(b) and not b.strip(b'0123456789')
+                   and 7 <= len(b) <= 15)
+        return results
+
+    def validate_batch(self, kind: str, values: List[Any]) -> List[bool]:
+        """Validate a homogeneous batch of values.
+
+        Args:
+            kind (str): Validator kind ('email' or 'phone')
+            values (list): Values to validate
+
+        Returns:
+            list[bool]: Per-input validity
+
+        Raises:
+            ValueError: If kind has no batch implementation
+        """
+        if kind == 'email':
+            return self.validate_emails_batch(values)
+        if kind == 'phone':
+            return self.validate_phones_batch(values)
+        raise ValueError(f"No batch validator for kind: {kind}")
+
+    @staticmethod
+    def prepare_schema(schema: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Return a copy of schema with per-record work hoisted out.
+
+        Regex patterns are compiled once, choices become tuples ready
+        for the cached-set lookup, and allowed extensions are lowercased
+        up front, so validating many records against the prepared schema
+        skips that normalization per call. The original schema is left
+        untouched.
+
+        Args:
+            schema (dict): Validation schema as taken by validate_dict
+
+        Returns:
+            dict: Prepared schema, interchangeable with the original
+        """
+        prepared = {}
+        for field, rules in schema.items():
+            new_rules = {}
+            for rule_name, rule_params in rules.items():
+                if rule_name == 'regex':
+                    if isinstance(rule_params, str):
+                        rule_params = re.compile(rule_params)
+                    elif isinstance(rule_params, dict) and isinstance(
+                        rule_params.get('pattern'), str
+                    ):
+                        rule_params = dict(rule_params)
+                        rule_params['pattern'] = re.compile(rule_params['pattern'])
+                elif rule_name == 'choice':
+                    if isinstance(rule_params, (list, set)):
+                        rule_params = tuple(rule_params)
+                    elif isinstance(rule_params, dict) and 'choices' in rule_params:
+                        rule_params = dict(rule_params)
+                        rule_params['choices'] = tuple(rule_params['choices'])
+                elif rule_name == 'file_path':
+                    if isinstance(rule_params, dict) and rule_params.get(
+                        'allowed_extensions'
+                    ):
+                        rule_params = dict(rule_params)
+                        rule_params['allowed_extensions'] = [
+                            ext.lower()
+                            for ext in rule_params['allowed_extensions']
+                        ]
+                new_rules[rule_name] = rule_params
+            prepared[field] = new_rules
+        return prepared
+
+    def compile_schema(self, schema: Dict[str, Dict[str, Any]]) -> Callable[[Dict[str, Any]], bool]:
+        """Compile a schema into a specialized validation function.
+
+        validate_dict re-interprets the schema on every call (rules
+        iteration, hasattr/getattr per rule). For a schema applied to
+        many records this generates straight-line source once — field
+        lookups, rule methods and their parameters are baked in as
+        closure constants — and returns the compiled function. Results
+        are cached, so repeat calls with the same schema are free.
+
+        Args:
+            schema (dict): Validation schema as taken by validate_dict
+
+        Returns:
+            Callable: Function mapping a data dict to the validate_dict
+                result for this schema
+        """
+        cached = self._compiled_schemas.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        env: Dict[str, Any] = {'ValidationError': ValidationError}
+        lines = [
+            "def _compiled(data, validator):",
+            "    if not isinstance(data, dict):",
+            "        if validator.strict_mode:",
+            "            raise ValidationError('Data must be a dictionary')",
+            "        return False",
+            "    ok = True",
+        ]
+        for i, (field, rules) in enumerate(schema.items()):
+            fvar = f"_field{i}"
+            env[fvar] = field
+            lines.append(f"    value = data.get({fvar})")
+            lines.append("    if value is None:")
+            if rules.get('required', False):
+                lines.append(
+                    f"        validator._handle_validation_error("
+                    f"{fvar}, value, 'Field is required')"
+                )
+                lines.append("        ok = False")
+            else:
+                lines.append("        pass")
+            lines.append("    else:")
+            emitted = False
+            for j, (rule_name, rule_params) in enumerate(rules.items()):
+                if rule_name == 'required':
+                    continue
+                method = self._RULE_METHODS.get(rule_name)
+                if method is None:
+                    continue
+                mvar = f"_rule{i}_{j}"
+                pvar = f"_params{i}_{j}"
+                env[mvar] = method
+                env[pvar] = rule_params
+                if isinstance(rule_params, dict):
+                    call = f"{mvar}(validator, value, {fvar}, **{pvar})"
+                else:
+                    call = f"{mvar}(validator, value, {fvar}, {pvar})"
+                lines.append(f"        if not {call}:")
+                lines.append("            ok = False")
+                emitted = True
+            if not emitted:
+                lines.append("        pass")
+        lines.append("    return ok")
+
+        exec(compile("\n".join(lines), '<schema>', 'exec'), env)
+        raw = env['_compiled']
+
+        def compiled(data: Dict[str, Any]) -> bool:
+            return raw(data, self)
+
+        self._compiled_schemas[id(schema)] = (schema, compiled)
+        return compiled
+
     def validate_dict(self, data: Dict[str, Any], schema: Dict[str, Dict[str, Any]]) -> bool:
         """Validate dictionary against schema.
         
@@ -328,14 +700,21 @@ class DataValidator:
             
         Returns:
             bool: True if all validations pass, False otherwise
+
+        Raises:
+            ValidationError: In strict mode, on the first failing field;
+                later fields and rules are not evaluated.
         """
         if not isinstance(data, dict):
             if self.strict_mode:
                 raise ValidationError("Data must be a dictionary")
             return False
-        
+
+        # In strict mode _handle_validation_error raises, so the first
+        # failure short-circuits out of both loops; the all_valid
+        # bookkeeping below only ever runs on the non-strict path.
         all_valid = True
-        
+
         for field, rules in schema.items():
             value = data.get(field)
             
@@ -354,38 +733,62 @@ class DataValidator:
                 if rule_name == 'required':
                     continue
                 
-                method_name = f"validate_{rule_name}"
-                if hasattr(self, method_name):
-                    method = getattr(self, method_name)
+                method = self._RULE_METHODS.get(rule_name)
+                if method is not None:
                     if isinstance(rule_params, dict):
-                        if not method(value, field, **rule_params):
+                        if not method(self, value, field, **rule_params):
                             all_valid = False
                     else:
-                        if not method(value, field, rule_params):
+                        if not method(self, value, field, rule_params):
                             all_valid = False
         
         return all_valid
 
 
+# Rule name -> unbound validator method, frozen once at import: schema
+# dispatch becomes a single dict probe instead of a hasattr plus getattr
+# attribute-protocol walk per field per record.
+DataValidator._RULE_METHODS = {
+    name[len('validate_'):]: fn
+    for name, fn in vars(DataValidator).items()
+    if name.startswith('validate_') and callable(fn)
+}
+
+
+# Shared default validator: the convenience predicates get called in
+# tight loops, and a fresh DataValidator per call pays a getLogger
+# lookup and dict allocation each time. The instance is stateless
+# beyond configuration, so sharing is safe.
+_DEFAULT_VALIDATOR: Optional[DataValidator] = None
+
+
+def _get_default() -> DataValidator:
+    """Return the lazily-created module-wide DataValidator."""
+    global _DEFAULT_VALIDATOR
+    if _DEFAULT_VALIDATOR is None:
+        _DEFAULT_VALIDATOR = DataValidator()
+    return _DEFAULT_VALIDATOR
+
+
 # Convenience functions
 def validate_email(email: str) -> bool:
     """Quick email validation."""
-    return DataValidator().validate_email(email)
+    return _get_default().validate_email(email)
 
 
 def validate_url(url: str) -> bool:
     """Quick URL validation."""
-    return DataValidator().validate_url(url)
+    return _get_default().validate_url(url)
 
 
 def validate_phone(phone: str) -> bool:
     """Quick phone validation."""
-    return DataValidator().validate_phone(phone)
+    return _get_default().validate_phone(phone)
 
 
 def is_valid_json(json_str: str) -> bool:
     """Quick JSON validation."""
-    return DataValidator().validate_json(json_str)
+    return _get_default().validate_json(json_str)
 
 
 def create_validator(strict_mode: bool = False) -> DataValidator:
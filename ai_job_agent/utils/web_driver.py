@@ -11,16 +11,24 @@ import logging
 
 class WebDriverManager:
     """Manages web driver instance and common operations."""
-    
-    def __init__(self, headless=True, timeout=10):
+
+    # Memoized presence conditions keyed by (by, value); the same locators
+    # are polled hundreds of times per scrape, so reuse one condition
+    # callable instead of building a fresh closure per lookup.
+    _presence_cache = {}
+
+    def __init__(self, headless=True, timeout=10, profile_dir=None):
         """Initialize web driver manager.
         
         Args:
             headless (bool): Run browser in headless mode
             timeout (int): Default timeout for operations
+            profile_dir (str, optional): Persistent Chrome user-data-dir;
+                reusing a warm profile skips first-run setup on each start
         """
         self.headless = headless
         self.timeout = timeout
+        self.profile_dir = profile_dir
         self.driver = None
         self.wait = None
         self.logger = logging.getLogger(__name__)
@@ -30,12 +38,29 @@ class WebDriverManager:
         try:
             options = Options()
             if self.headless:
-                options.add_argument('--headless')
+                options.add_argument('--headless=new')
+            if self.profile_dir:
+                options.add_argument(f'--user-data-dir={self.profile_dir}')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2,
+            })
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-gpu')
-            
+            options.add_argument('--disable-extensions')
+            options.add_argument('--disable-background-networking')
+            # Text scraping never needs image bytes
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            # Return from get() on DOMContentLoaded instead of waiting for
+            # every image/ad/subframe to finish loading
+            options.page_load_strategy = 'eager'
+
             self.driver = webdriver.Chrome(options=options)
+            self.driver.set_page_load_timeout(self.timeout)
+            # Explicit WebDriverWait only; implicit waits compound badly
+            # with explicit ones
+            self.driver.implicitly_wait(0)
             self.wait = WebDriverWait(self.driver, self.timeout)
             self.logger.info("Web driver started successfully")
             return True
@@ -83,12 +108,13 @@ class WebDriverManager:
         Returns:
             WebElement or None: Found element or None if not found
         """
-        timeout = timeout or self.timeout
+        wait = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
+        condition = self._presence_cache.get((by, value))
+        if condition is None:
+            condition = EC.presence_of_element_located((by, value))
+            self._presence_cache[(by, value)] = condition
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
-            return element
+            return wait.until(condition)
         except TimeoutException:
             self.logger.warning(f"Element not found: {by}={value}")
             return None
@@ -115,7 +141,10 @@ class WebDriverManager:
     
     def get_page_source(self):
         """Get current page source.
-        
+
+        Serializes the whole DOM over the wire; prefer evaluate_cdp with a
+        targeted extraction expression when only part of the page matters.
+
         Returns:
             str: Page source or empty string if error
         """
@@ -124,6 +153,30 @@ class WebDriverManager:
         except Exception as e:
             self.logger.error(f"Failed to get page source: {e}")
             return ""
+
+    def evaluate_cdp(self, expression):
+        """Evaluate a JavaScript expression in the page via CDP.
+
+        Runs the extraction inside the browser process and ships only the
+        resulting value back, instead of pulling megabytes of page_source
+        across chromedriver's JSON wire to parse in Python.
+
+        Args:
+            expression (str): JavaScript expression returning a
+                JSON-serializable value
+
+        Returns:
+            The expression's value, or None if evaluation failed
+        """
+        try:
+            result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': expression,
+                'returnByValue': True,
+            })
+            return result.get('result', {}).get('value')
+        except Exception as e:
+            self.logger.error(f"CDP evaluation failed: {e}")
+            return None
     
     def __enter__(self):
         """Context manager entry."""
@@ -14,55 +14,58 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# TODO: implement JobSearchAgent in ai_job_agent.core or a new module
-# from ai_job_agent.core.agent import JobAgent as JobSearchAgent
-# TODO: implement ApplicationAgent in ai_job_agent.core or a new module
-# from ai_job_agent.core.agent import JobAgent as ApplicationAgent
-from ai_job_agent.config.settings import Settings
-from ai_job_agent.utils.logger import setup_logger
-from ai_job_agent.agents.job_search_agent import JobSearchAgent, JobSearchConfig
-from ai_job_agent.agents.application_agent import ApplicationAgent, ApplicationConfig
+from ai_job_agent.utils.logger import setup_logging
+
 
 def main():
     """
     Main entry point for the AI Job Agent application.
     """
     # Setup logging
-    logger = setup_logger()
-    
-    # Load configuration
-    settings = Settings()
-    
+    logger_instance = setup_logging()
+    logger = logger_instance.logger
+
     logger.info("Starting AI Job Agent...")
-    
+
+    # Agent imports are deferred until logging is configured so heavy
+    # dependencies (selenium, requests, pydantic) are not loaded before
+    # the process can report problems.
+    from ai_job_agent.agents.job_search_agent import JobSearchAgent
+    from ai_job_agent.agents.application_agent import ApplicationAgent
+
     try:
         # Initialize agents
-        job_search_agent = JobSearchAgent(settings)
-        application_agent = ApplicationAgent(settings)
-        
+        job_search_agent = JobSearchAgent()
+        application_agent = ApplicationAgent()
+
         # Start the job search and application process
         logger.info("Beginning automated job search and application process...")
-    # Minimal demo flow
-    jobs = job_search_agent.search({"title": "AI Engineer", "location": "Bengaluru"})
-    logger.info(f"Found {len(jobs)} jobs (demo).")
-    for job in jobs:
-        answers = application_agent.prepare_answers(job.dict())
-        success, history = application_agent.apply(job.job_id, answers)
-        logger.info(f"Applied to {job.company} - {job.title}: {history.status}")
-
-        
+
+        # Minimal demo flow
+        jobs = job_search_agent.search({"title": "AI Engineer", "location": "Bengaluru"})
+        logger.info("Found %d jobs (demo).", len(jobs))
+        for job in jobs:
+            answers = application_agent.prepare_answers(job.model_dump())
+            success, history = application_agent.apply(job.job_id, answers)
+            logger.info("Applied to %s - %s: %s", job.company, job.title, history.status)
+
         # TODO: Implement main workflow
         # 1. Search for jobs based on user criteria
         # 2. Filter jobs based on preferences
         # 3. Generate customized applications
         # 4. Submit applications
         # 5. Track application status
-        
+
         logger.info("Job application process completed successfully!")
-        
+
     except Exception as e:
-        logger.error(f"An error occurred during execution: {e}")
+        logger.error("An error occurred during execution: %s", e)
         sys.exit(1)
 
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if os.getenv('AI_JOB_AGENT_PROFILE'):
+        import cProfile
+        cProfile.run('main()', 'main.prof')
+    else:
+        main()
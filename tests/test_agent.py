@@ -1,42 +1,22 @@
 import pytest
-from unittest.mock import Mock, patch
 
 # Test file for agent functionality
+#
+# The individual placeholder tests are collapsed into one parametrized
+# skeleton: pytest collects a single function instead of many no-op
+# items, and the skips keep unimplemented scenarios out of coverage
+# reports instead of "passing".
 
-class TestAgent:
-    """Test cases for the main agent functionality."""
-    
-    def test_agent_initialization(self):
-        """Test that agent initializes correctly."""
-        # TODO: Implement test for agent initialization
-        assert True
-    
-    def test_agent_job_search(self):
-        """Test agent job search functionality."""
-        # TODO: Implement test for job search
-        assert True
-    
-    def test_agent_application_process(self):
-        """Test agent application process."""
-        # TODO: Implement test for application process
-        assert True
-    
-    # TODO: update patch target when module exists
-# @patch('ai_job_agent.core.agent')
-    def test_agent_with_mock(self, mock_agent):
-        """Test agent with mocked dependencies."""
-        # TODO: Implement test with mocked dependencies
-        mock_agent.return_value = Mock()
-        assert True
+AGENT_SCENARIOS = [
+    'agent_initialization',
+    'agent_job_search',
+    'agent_application_process',
+    'agent_with_mock',
+    'agent_configuration',
+    'agent_error_handling',
+]
 
-# Additional test functions
 
-def test_agent_configuration():
-    """Test agent configuration loading."""
-    # TODO: Implement configuration test
-    assert True
-
-def test_agent_error_handling():
-    """Test agent error handling."""
-    # TODO: Implement error handling test
-    assert True
+@pytest.mark.parametrize('name', AGENT_SCENARIOS)
+def test_todo(name):
+    pytest.skip(f"not implemented: {name}")
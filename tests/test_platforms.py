@@ -1,82 +1,28 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 
 # Test file for platform-specific functionality
-
-class TestJobPlatforms:
-    """Test cases for job platform integrations."""
-    
-    def test_linkedin_integration(self):
-        """Test LinkedIn platform integration."""
-        # TODO: Implement LinkedIn integration test
-        assert True
-    
-    def test_indeed_integration(self):
-        """Test Indeed platform integration."""
-        # TODO: Implement Indeed integration test
-        assert True
-    
-    def test_glassdoor_integration(self):
-        """Test Glassdoor platform integration."""
-        # TODO: Implement Glassdoor integration test
-        assert True
-    
-    @patch('requests.get')
-    def test_platform_api_call(self, mock_get):
-        """Test platform API calls."""
-        # TODO: Implement API call test
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {'jobs': []}
-        assert True
-
-class TestPlatformAuth:
-    """Test cases for platform authentication."""
-    
-    def test_oauth_authentication(self):
-        """Test OAuth authentication flow."""
-        # TODO: Implement OAuth test
-        assert True
-    
-    def test_api_key_validation(self):
-        """Test API key validation."""
-        # TODO: Implement API key validation test
-        assert True
-    
-    def test_session_management(self):
-        """Test session management."""
-        # TODO: Implement session management test
-        assert True
-
-class TestPlatformScraping:
-    """Test cases for web scraping functionality."""
-    
-    @patch('selenium.webdriver.Chrome')
-    def test_selenium_scraping(self, mock_driver):
-        """Test Selenium-based scraping."""
-        # TODO: Implement Selenium scraping test
-        mock_driver.return_value = MagicMock()
-        assert True
-    
-    @patch('requests.get')
-    def test_http_scraping(self, mock_get):
-        """Test HTTP-based scraping."""
-        # TODO: Implement HTTP scraping test
-        mock_get.return_value.text = '<html></html>'
-        assert True
-
-# Additional test functions
-
-def test_platform_rate_limiting():
-    """Test platform rate limiting functionality."""
-    # TODO: Implement rate limiting test
-    assert True
-
-def test_platform_error_handling():
-    """Test platform-specific error handling."""
-    # TODO: Implement platform error handling test
-    assert True
-
-def test_platform_data_parsing():
-    """Test parsing of platform-specific data formats."""
-    # TODO: Implement data parsing test
-    assert True
+#
+# The individual placeholder tests are collapsed into one parametrized
+# skeleton: pytest collects a single function instead of many no-op
+# items, and the skips keep unimplemented scenarios out of coverage
+# reports instead of "passing".
+
+PLATFORM_SCENARIOS = [
+    'linkedin_integration',
+    'indeed_integration',
+    'glassdoor_integration',
+    'platform_api_call',
+    'oauth_authentication',
+    'api_key_validation',
+    'session_management',
+    'selenium_scraping',
+    'http_scraping',
+    'platform_rate_limiting',
+    'platform_error_handling',
+    'platform_data_parsing',
+]
+
+
+@pytest.mark.parametrize('name', PLATFORM_SCENARIOS)
+def test_todo(name):
+    pytest.skip(f"not implemented: {name}")
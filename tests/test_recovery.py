@@ -1,114 +1,98 @@
+import sqlite3
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import time
+
+from ai_job_agent.recovery.state_manager import _ApswConnection
 
 # Test file for recovery and resilience functionality
+#
+# The individual placeholder tests are collapsed into one parametrized
+# skeleton: pytest collects a single function instead of many no-op
+# items, and the skips keep unimplemented scenarios out of coverage
+# reports instead of "passing".
+
+RECOVERY_SCENARIOS = [
+    'network_failure_recovery',
+    'api_timeout_recovery',
+    'authentication_failure_recovery',
+    'retry_mechanism',
+    'session_data_backup',
+    'application_state_recovery',
+    'partial_data_recovery',
+    'cache_invalidation_recovery',
+    'health_check_monitoring',
+    'circuit_breaker_pattern',
+    'error_logging_and_alerting',
+    'fallback_mechanisms',
+    'reduced_functionality_mode',
+    'offline_mode_capability',
+    'recovery_time_objectives',
+    'recovery_point_objectives',
+    'disaster_recovery_procedures',
+]
+
+
+@pytest.mark.parametrize('name', RECOVERY_SCENARIOS)
+def test_todo(name):
+    pytest.skip(f"not implemented: {name}")
 
-class TestErrorRecovery:
-    """Test cases for error recovery mechanisms."""
-    
-    def test_network_failure_recovery(self):
-        """Test recovery from network failures."""
-        # TODO: Implement network failure recovery test
-        assert True
-    
-    def test_api_timeout_recovery(self):
-        """Test recovery from API timeouts."""
-        # TODO: Implement API timeout recovery test
-        assert True
-    
-    def test_authentication_failure_recovery(self):
-        """Test recovery from authentication failures."""
-        # TODO: Implement auth failure recovery test
-        assert True
-    
-    @patch('time.sleep')
-    def test_retry_mechanism(self, mock_sleep):
-        """Test retry mechanism with exponential backoff."""
-        # TODO: Implement retry mechanism test
-        mock_sleep.return_value = None
-        assert True
-
-class TestDataRecovery:
-    """Test cases for data recovery and backup."""
-    
-    def test_session_data_backup(self):
-        """Test session data backup functionality."""
-        # TODO: Implement session data backup test
-        assert True
-    
-    def test_application_state_recovery(self):
-        """Test application state recovery."""
-        # TODO: Implement application state recovery test
-        assert True
-    
-    def test_partial_data_recovery(self):
-        """Test recovery of partially completed operations."""
-        # TODO: Implement partial data recovery test
-        assert True
-    
-    def test_cache_invalidation_recovery(self):
-        """Test recovery from cache invalidation."""
-        # TODO: Implement cache recovery test
-        assert True
-
-class TestFailureDetection:
-    """Test cases for failure detection systems."""
-    
-    def test_health_check_monitoring(self):
-        """Test health check monitoring system."""
-        # TODO: Implement health check test
-        assert True
-    
-    def test_circuit_breaker_pattern(self):
-        """Test circuit breaker implementation."""
-        # TODO: Implement circuit breaker test
-        assert True
-    
-    @patch('logging.error')
-    def test_error_logging_and_alerting(self, mock_log):
-        """Test error logging and alerting mechanisms."""
-        # TODO: Implement error logging test
-        mock_log.return_value = None
-        assert True
-
-class TestGracefulDegradation:
-    """Test cases for graceful degradation scenarios."""
-    
-    def test_fallback_mechanisms(self):
-        """Test fallback to alternative services."""
-        # TODO: Implement fallback mechanism test
-        assert True
-    
-    def test_reduced_functionality_mode(self):
-        """Test operation in reduced functionality mode."""
-        # TODO: Implement reduced functionality test
-        assert True
-    
-    def test_offline_mode_capability(self):
-        """Test offline mode capabilities."""
-        # TODO: Implement offline mode test
-        assert True
-
-# Additional test functions
-
-def test_recovery_time_objectives():
-    """Test recovery time objectives (RTO)."""
-    # TODO: Implement RTO test
-    assert True
-
-def test_recovery_point_objectives():
-    """Test recovery point objectives (RPO)."""
-    # TODO: Implement RPO test
-    assert True
-
-def test_disaster_recovery_procedures():
-    """Test disaster recovery procedures."""
-    # TODO: Implement disaster recovery test
-    assert True
 
 @pytest.mark.slow
 def test_long_term_recovery_scenarios():
     """Test long-term recovery scenarios."""
-    # TODO: Implement long-term recovery test
-    assert True
+    pytest.skip("not implemented: long_term_recovery_scenarios")
+
+
+class _FakeApswConnection:
+    """sqlite3-backed stand-in exposing the apsw surface the facade uses.
+
+    Mirrors apsw's autocommit-plus-explicit-transaction behavior: the
+    context manager opens a real transaction, so statements that SQLite
+    forbids inside one (e.g. switching into WAL) fail just as they would
+    on the real driver.
+    """
+
+    def __init__(self, path):
+        self._conn = sqlite3.connect(path, isolation_level=None)
+
+    def cursor(self):
+        return self._conn.cursor()
+
+    def totalchanges(self):
+        return self._conn.total_changes
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        self._conn.execute("BEGIN")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
+
+
+def test_apsw_facade(tmp_path):
+    """The _ApswConnection facade supports the StateManager call surface."""
+    conn = _ApswConnection(_FakeApswConnection(str(tmp_path / "facade.db")))
+
+    # Switching into WAL must fail inside a transaction, as on the real
+    # driver, and succeed outside one (the _init_database ordering)
+    with pytest.raises(sqlite3.OperationalError):
+        with conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA journal_mode=WAL")
+
+    with conn:
+        conn.execute("CREATE TABLE t (k TEXT PRIMARY KEY, v INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?, ?)", [("a", 1), ("b", 2)])
+
+    before = conn.total_changes
+    with conn:
+        conn.execute("DELETE FROM t WHERE k = 'a'")
+    assert conn.total_changes - before == 1
+
+    assert conn.execute("SELECT k, v FROM t").fetchall() == [("b", 2)]
+    conn.commit()  # no-op, as on apsw
+    conn.close()